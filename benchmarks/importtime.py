@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Measure the cold-start import time of the package and each CLI command.
+
+Every target is imported in a fresh interpreter with ``python -X importtime`` (best of
+--repeat runs). The heaviest modules it pulls in are listed, and the exit status is 1
+when a target is over its budget, so short cron runs stay cheap to start.
+
+Usage:
+  python -m benchmarks.importtime [--repeat 5] [--top 5] [--scale 1.0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Target -> (module imported, budget in ms)
+TARGETS = {
+    "irctc_report": ("irctc_report", 50),
+    "generate": ("irctc_report.cli.generate_report", 150),
+    "auto": ("irctc_report.cli.automate_report", 100),
+    "pdf": ("irctc_report.cli.to_pdf", 100),
+    "serve": ("irctc_report.cli.app_upload", 400),
+}
+
+
+def measure(module: str) -> tuple[float, list[tuple[float, str]]]:
+    """Cumulative import time of ``module`` in ms, and (self ms, name) of what it imported."""
+    pythonpath = [str(PROJECT_ROOT / "src"), os.environ.get("PYTHONPATH", "")]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in pythonpath if p))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import failed")
+    total = None
+    modules = []
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        top_level = not name[1:].startswith(" ")
+        name = name.strip()
+        modules.append((int(self_us) / 1000, name))
+        if top_level:
+            if name == module:
+                total = int(cumulative_us) / 1000
+                break
+            # Interpreter startup (site, encodings, ...), not imported by the target
+            modules = []
+    if total is None:
+        raise RuntimeError(f"{module} not found in -X importtime output")
+    return total, sorted(modules, reverse=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of the CLI commands.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per target (best is kept)")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest imported modules listed per target")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget (e.g. 2 on a slow machine)")
+    args = parser.parse_args()
+
+    over = []
+    for target, (module, budget) in TARGETS.items():
+        budget *= args.scale
+        try:
+            best, heaviest = min((measure(module) for _ in range(args.repeat)), key=lambda r: r[0])
+        except RuntimeError as e:
+            print(f"  {target:<14} failed: {e}", file=sys.stderr)
+            over.append(target)
+            continue
+        flag = "  OVER BUDGET" if best > budget else ""
+        print(f"  {target:<14} {best:8.1f} ms (budget {budget:.0f} ms){flag}")
+        for self_ms, name in heaviest[: args.top]:
+            print(f"      {self_ms:7.1f} ms  {name}")
+        if flag:
+            over.append(target)
+    if over:
+        print(f"Over budget: {', '.join(over)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark the load → render → PDF pipeline on synthetic data.
+
+Each stage is timed separately (best of --repeat runs) and, in a separate traced run,
+its peak Python memory is measured with tracemalloc. Results are written as JSON to
+benchmarks/results/ and compared with the previous result file.
+
+Usage:
+  PYTHONPATH=src python -m benchmarks.run [--sizes 1000,10000,100000] [--pdf] [--aliases] [--bom]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.synth import generate
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+TEMPLATE_PATH = PROJECT_ROOT / "templates" / "IRCTC_Takedown_Report_template.html"
+# A stage is flagged when it is this much slower than in the previous result
+REGRESSION_THRESHOLD = 1.10
+
+
+def _measure(fn, repeat: int, memory: bool) -> tuple[float, float | None]:
+    """Best wall time of ``repeat`` runs, and peak traced memory (MB) of one more run."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+    return best, peak_mb
+
+
+def bench_size(rows: int, work_dir: Path, args) -> list[dict]:
+    from irctc_report import build_context, convert_to_pdf, render_to_file
+    from irctc_report.loader import _load_all
+
+    data_dir = generate(work_dir / f"data_{rows}", rows, aliases=args.aliases, bom=args.bom)
+    html_path = work_dir / f"report_{rows}.html"
+    context = build_context(data_dir)
+    # Warm the parsed-table cache so build_context_cached measures the hit path
+    table_cache_dir = work_dir / f"table_cache_{rows}"
+    build_context(data_dir, table_cache_dir=table_cache_dir)
+    # Compile the template once so the render stage measures rendering only
+    render_to_file(TEMPLATE_PATH, context, html_path)
+
+    stages = [
+        # The CSV loading alone, which is what the table cache replaces
+        ("load", lambda: _load_all(data_dir, 1), True),
+        ("load_cached", lambda: _load_all(data_dir, 1, table_cache_dir), True),
+        ("build_context", lambda: build_context(data_dir), True),
+        ("build_context_cached", lambda: build_context(data_dir, table_cache_dir=table_cache_dir), True),
+        ("render_to_file", lambda: render_to_file(TEMPLATE_PATH, context, html_path), True),
+    ]
+    if args.pdf:
+        # Chromium memory is outside Python; only time this stage
+        stages.append(("convert_to_pdf", lambda: convert_to_pdf(html_path), False))
+
+    results = []
+    for stage, fn, memory in stages:
+        try:
+            seconds, peak_mb = _measure(fn, args.repeat, memory and not args.no_memory)
+        except Exception as e:
+            print(f"  {rows:>9} {stage:<20} failed: {e}", file=sys.stderr)
+            continue
+        results.append({"rows": rows, "stage": stage, "seconds": seconds, "peak_mb": peak_mb})
+        mem = f"{peak_mb:9.1f} MB" if peak_mb is not None else ""
+        print(f"  {rows:>9} {stage:<20} {seconds:9.4f} s {mem}")
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() or None
+
+
+def _latest_result(exclude: Path | None = None) -> Path | None:
+    files = sorted(p for p in RESULTS_DIR.glob("*.json") if p != exclude)
+    return files[-1] if files else None
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Lines describing per-stage changes vs ``previous``; regressions are marked."""
+    before = {(r["rows"], r["stage"]): r for r in previous.get("results", [])}
+    lines = []
+    for r in current["results"]:
+        old = before.get((r["rows"], r["stage"]))
+        if not old or not old["seconds"]:
+            continue
+        ratio = r["seconds"] / old["seconds"]
+        flag = "  REGRESSION" if ratio > REGRESSION_THRESHOLD else ""
+        lines.append(
+            f"  {r['rows']:>9} {r['stage']:<20} {old['seconds']:9.4f} s -> {r['seconds']:9.4f} s ({ratio:5.2f}x){flag}"
+        )
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the report pipeline on synthetic data.")
+    parser.add_argument("--sizes", default="1000,10000", help="Comma-separated taken_down row counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (best is kept)")
+    parser.add_argument("--pdf", action="store_true", help="Also benchmark PDF conversion (Playwright)")
+    parser.add_argument("--aliases", action="store_true", help="Use header alias variants")
+    parser.add_argument("--bom", action="store_true", help="Write CSVs with a UTF-8 BOM")
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc peak-memory runs")
+    parser.add_argument("--output", type=Path, default=None, help="Result JSON path (default: results/<timestamp>.json)")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    started = datetime.now()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="irctc-bench-") as tmp:
+        for rows in sizes:
+            results.extend(bench_size(rows, Path(tmp), args))
+
+    report = {
+        "timestamp": started.isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {"aliases": args.aliases, "bom": args.bom, "repeat": args.repeat},
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{started.strftime('%Y%m%d-%H%M%S')}.json"
+    previous_path = _latest_result(exclude=output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results saved: {output}")
+
+    if previous_path:
+        lines = compare(report, json.loads(previous_path.read_text(encoding="utf-8")))
+        if lines:
+            print(f"Compared with {previous_path.name}:")
+            print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
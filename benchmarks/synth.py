@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic report CSVs of a given size for benchmarking.
+
+Usage:
+  PYTHONPATH=src python -m benchmarks.synth --rows 100000 --out /tmp/bench_data [--aliases] [--bom]
+"""
+
+import argparse
+import csv
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+from irctc_report.loader import _CANONICAL_KEYS, TABLE_COLUMNS
+
+THREAT_CATEGORIES = ["Phishing Website", "Typosquatted Domain", "Fake Mobile App"]
+REMARKS = {
+    "taken_down.csv": ["Domain or app has been successfully removed."],
+    "under_review.csv": ["Domain not hosting active content; may display lander/parking/sale page."],
+    "in_progress.csv": ["Takedown request initiated; under review by registrar/hosting provider."],
+}
+KEYWORDS = ["irctc", "tatkal", "rail", "ecatering", "tejas", "railmeal", "booking"]
+TLDS = ["in", "co.in", "com", "org", "net", "pages.dev", "vercel.app"]
+BASE_DATE = date(2025, 1, 1)
+
+
+def _domain(rng: random.Random, i: int) -> str:
+    name = f"{rng.choice(KEYWORDS)}{rng.choice(['', '-', 'x'])}{i}.{rng.choice(TLDS)}"
+    form = rng.random()
+    if form < 0.2:
+        return f"https://www.{name}/"
+    if form < 0.3:
+        return name.upper()
+    return name
+
+
+def _dmy(d: date) -> str:
+    return d.strftime("%d/%m/%Y")
+
+
+def write_table(path: Path, filename: str, rows: int, rng: random.Random, aliases: bool, bom: bool, start: int) -> None:
+    columns = TABLE_COLUMNS[filename]
+    header = [rng.choice(_CANONICAL_KEYS[c]) if aliases else c for c in columns]
+    with open(path, "w", newline="", encoding="utf-8-sig" if bom else "utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(header)
+        for i in range(start, start + rows):
+            reported = BASE_DATE + timedelta(days=rng.randrange(365))
+            values = {
+                "domain_url": _domain(rng, i),
+                "reported_on": _dmy(reported),
+                "last_updated": _dmy(reported + timedelta(days=rng.randrange(1, 60))),
+                "threat_category": rng.choice(THREAT_CATEGORIES),
+                "remarks": rng.choice(REMARKS[filename]),
+            }
+            w.writerow([values[c] for c in columns])
+
+
+def generate(out_dir: Path, rows: int, aliases: bool = False, bom: bool = False, seed: int = 0) -> Path:
+    """Write report_meta.csv plus the three tables to ``out_dir``.
+
+    taken_down.csv gets ``rows`` rows; under_review.csv and in_progress.csv a tenth each.
+    With ``aliases`` headers use random variants from the loader's alias lists; with
+    ``bom`` files start with a UTF-8 BOM.
+    """
+    rng = random.Random(seed)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / "report_meta.csv", "w", newline="", encoding="utf-8-sig" if bom else "utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["report_date", "prepared_by", "reporting_window", "newly_completed_domain",
+                    "newly_under_review_domain", "reactivated_domains", "closing_note"])
+        w.writerow(["01 January 2026", "Benchmark", "Rolling", "irctc0.in", "irctc1.in",
+                    "irctc2.in; https://www.irctc3.in/", "Synthetic data."])
+    sizes = {"taken_down.csv": rows, "under_review.csv": rows // 10, "in_progress.csv": rows // 10}
+    start = 0
+    for filename, n in sizes.items():
+        write_table(out_dir / filename, filename, n, rng, aliases, bom, start)
+        start += n
+    return out_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic report CSVs.")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows in taken_down.csv")
+    parser.add_argument("--out", type=Path, required=True, help="Output data directory")
+    parser.add_argument("--aliases", action="store_true", help="Use header alias variants")
+    parser.add_argument("--bom", action="store_true", help="Write UTF-8 BOM")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    out = generate(args.out, args.rows, args.aliases, args.bom, args.seed)
+    print(f"Data written: {out}")
+
+
+if __name__ == "__main__":
+    main()
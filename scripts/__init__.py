@@ -1 +1,12 @@
-# Scripts package
+"""Run the commands from a checkout without installing: see :mod:`irctc_report.cli`.
+
+``python -m scripts <command>`` or ``python -m scripts.<name>``. Importing this package
+puts src/ on sys.path. It is not part of the installed distribution.
+"""
+
+import sys
+from pathlib import Path
+
+_src = Path(__file__).resolve().parent.parent / "src"
+if _src.exists() and str(_src) not in sys.path:
+    sys.path.insert(0, str(_src))
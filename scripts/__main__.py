@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""In-tree launcher for :mod:`irctc_report.cli.__main__`."""
+
+import sys
+from pathlib import Path
+
+if not __package__:
+    # Run as a file (python scripts/<name>.py): make the scripts package importable
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import scripts  # noqa: F401  (puts src/ on sys.path)
+from irctc_report.cli.__main__ import main
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,52 @@
 """
 IRCTC Takedown Report – load CSV data, render HTML, convert to PDF.
+
+Public names are imported from their submodules on first use, so e.g.
+``from irctc_report import build_context`` does not load the PDF code.
 """
 
-from .constants import DEFAULT_KEY_OUTCOMES
-from .loader import build_context, load_meta, load_table
-from .pdf import convert_to_pdf
-from .render import render_html
-
-__all__ = [
-    "DEFAULT_KEY_OUTCOMES",
-    "build_context",
-    "load_meta",
-    "load_table",
-    "render_html",
-    "convert_to_pdf",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "DEFAULT_KEY_OUTCOMES": "constants",
+    "build_context": "loader",
+    "build_context_from_streams": "loader",
+    "load_meta": "loader",
+    "load_table": "loader",
+    "iter_table": "loader",
+    "render_html": "render",
+    "render_to_file": "render",
+    "convert_to_pdf": "pdf",
+    "render_pdf": "pdf",
+    "PdfRenderer": "pdf",
+    "get_renderer": "pdf",
+    "convert_many": "pdf",
+    "PdfResult": "pdf",
+}
+
+__all__ = ["metrics", *_EXPORTS]
+
+if TYPE_CHECKING:
+    from . import metrics
+    from .constants import DEFAULT_KEY_OUTCOMES
+    from .loader import build_context, build_context_from_streams, iter_table, load_meta, load_table
+    from .pdf import PdfRenderer, PdfResult, convert_many, convert_to_pdf, get_renderer, render_pdf
+    from .render import render_html, render_to_file
+
+
+def __getattr__(name: str):
+    if name == "metrics":
+        return importlib.import_module(".metrics", __name__)
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache, so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
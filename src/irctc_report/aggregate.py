@@ -0,0 +1,142 @@
+"""Report statistics computed in one pass over the loaded tables.
+
+Per table: counts per threat category, age buckets of ``reported_on`` relative to the
+report date and, for taken-down rows, days from ``reported_on`` to ``last_updated``
+(time to takedown). Dates are dd/mm/yyyy strings that repeat heavily, so they go
+through a memoized parser. Bucketing and averages use NumPy when it is installed and
+the table is large, and plain Python otherwise.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from datetime import date
+from functools import lru_cache
+
+from .history import parse_report_date
+
+# (upper bound in days or None, label); ages above every bound go in the last bucket
+AGE_BUCKETS = ((7, "0–7 days"), (30, "8–30 days"), (90, "31–90 days"), (None, "Over 90 days"))
+# Plural display names for threat_category values (others are shown as they are)
+THREAT_LABELS = {
+    "Phishing Website": "Phishing Websites",
+    "Typosquatted Domain": "Typosquatted Domains",
+    "Fake Mobile App": "Fake Mobile Applications",
+}
+# Use NumPy from this many values up (below it, conversion costs more than it saves)
+NUMPY_MIN_ROWS = 10_000
+
+_BOUNDS = [bound for bound, _ in AGE_BUCKETS if bound is not None]
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """NumPy, or None if not installed.
+
+    Imported on the first large table only: the import alone takes longer than
+    aggregating a typical daily report.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=4096)
+def parse_dmy(value: str) -> int | None:
+    """Proleptic ordinal of a dd/mm/yyyy date (None if empty or invalid)."""
+    parts = value.split("/")
+    if len(parts) != 3:
+        return None
+    try:
+        day, month, year = (int(p) for p in parts)
+        return date(year, month, day).toordinal()
+    except ValueError:
+        return None
+
+
+def _bucket_counts(ages: list[int]) -> list[int]:
+    np = _numpy() if len(ages) >= NUMPY_MIN_ROWS else None
+    if np is not None:
+        index = np.searchsorted(np.asarray(_BOUNDS), np.asarray(ages), side="left")
+        return np.bincount(index, minlength=len(AGE_BUCKETS)).tolist()
+    counts = [0] * len(AGE_BUCKETS)
+    for age in ages:
+        counts[bisect_left(_BOUNDS, age)] += 1
+    return counts
+
+
+def _mean(values: list[int]) -> float | None:
+    if not values:
+        return None
+    np = _numpy() if len(values) >= NUMPY_MIN_ROWS else None
+    if np is not None:
+        return float(np.mean(np.asarray(values)))
+    return sum(values) / len(values)
+
+
+def threat_labels(categories) -> list[str]:
+    """Display names for threat categories, e.g. "Phishing Website" -> "Phishing Websites"."""
+    return [THREAT_LABELS.get(c, c) for c in categories]
+
+
+def aggregate(tables: dict, report_date: str = "", sla_days: int | None = None) -> dict:
+    """Statistics for ``tables`` (status -> rows); ages are counted up to ``report_date``.
+
+    Returns a dict with:
+
+    - ``threats``: [(category, count)] over all tables, most frequent first
+    - ``threats_by_status``: status -> {category: count} for one table, in the same order
+    - ``threat_types`` / ``threat_types_by_status``: the categories of those lists as
+      display names (see THREAT_LABELS)
+    - ``age_buckets``: status -> [(label, count)] per AGE_BUCKETS (rows with no valid
+      reported_on are left out)
+    - ``oldest_open_days``: age of the oldest under-review / in-progress row (or None)
+    - ``over_sla``: status -> open rows older than ``sla_days`` (empty without sla_days)
+    - ``mean_days_to_takedown``: mean of last_updated - reported_on over taken-down rows
+      with both dates valid (None if there are none)
+    """
+    parsed = parse_report_date(report_date) if report_date else None
+    today = (parsed or date.today()).toordinal()
+    parse = parse_dmy
+    total = Counter()
+    by_status = {}
+    age_buckets = {}
+    oldest_open = None
+    over_sla = {}
+    durations = []
+    for status, rows in tables.items():
+        categories = Counter()
+        ages = []
+        with_durations = status == "taken_down"
+        for row in rows:
+            categories[row.threat_category] += 1
+            reported = parse(row.reported_on)
+            if reported is None:
+                continue
+            ages.append(today - reported)
+            if with_durations:
+                updated = parse(row.last_updated)
+                if updated is not None and updated >= reported:
+                    durations.append(updated - reported)
+        categories.pop("", None)
+        total.update(categories)
+        by_status[status] = dict(categories.most_common())
+        age_buckets[status] = list(zip((label for _, label in AGE_BUCKETS), _bucket_counts(ages)))
+        if status == "taken_down" or not ages:
+            continue
+        oldest = max(ages)
+        oldest_open = oldest if oldest_open is None else max(oldest_open, oldest)
+        if sla_days is not None:
+            over_sla[status] = sum(1 for age in ages if age > sla_days)
+    threats = total.most_common()
+    return {
+        "threats": threats,
+        "threats_by_status": by_status,
+        "threat_types": threat_labels(c for c, _ in threats),
+        "threat_types_by_status": {s: threat_labels(counts) for s, counts in by_status.items()},
+        "age_buckets": age_buckets,
+        "oldest_open_days": oldest_open,
+        "over_sla": over_sla,
+        "mean_days_to_takedown": _mean(durations),
+    }
@@ -0,0 +1,164 @@
+"""Generate the report for many clients (one data directory each) in one run."""
+
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+REPORT_HTML_NAME = "IRCTC_Takedown_Report_generated.html"
+SUMMARY_FIELDS = ["client", "status", "load_s", "render_s", "pdf_s", "html", "pdf", "error"]
+
+
+def discover_clients(source: Path) -> list[tuple[str, Path]]:
+    """List (client, data_dir) pairs from a directory of client dirs or a manifest CSV.
+
+    A directory source yields every immediate subdirectory containing report_meta.csv,
+    named after the subdirectory. A manifest CSV has ``client`` and ``data_dir`` columns;
+    relative data dirs are resolved against the manifest's directory.
+
+    Client names become directories under the batch output dir, so a manifest client
+    that is not a plain name (path separator, ``..``) or is listed twice raises
+    ValueError.
+    """
+    source = Path(source)
+    if source.is_dir():
+        return [
+            (d.name, d.resolve())
+            for d in sorted(source.iterdir())
+            if d.is_dir() and (d / "report_meta.csv").exists()
+        ]
+    if not source.exists():
+        raise FileNotFoundError(f"Missing {source}")
+    clients = []
+    problems = []
+    seen: dict[str, int] = {}
+    with open(source, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            client = (row.get("client") or "").strip()
+            data_dir = (row.get("data_dir") or "").strip()
+            if not client or not data_dir:
+                continue
+            line = reader.line_num
+            if not _is_plain_name(client):
+                problems.append(f"{source.name}:{line}: client {client!r} is not a plain directory name")
+                continue
+            # casefold: the output dirs may be on a case-insensitive filesystem
+            first = seen.setdefault(client.casefold(), line)
+            if first != line:
+                problems.append(f"{source.name}:{line}: duplicate client {client!r} (first on line {first})")
+                continue
+            clients.append((client, (source.parent / data_dir).resolve()))
+    if problems:
+        raise ValueError("invalid batch manifest:\n" + "\n".join(f"  {p}" for p in problems))
+    return clients
+
+
+def _is_plain_name(name: str) -> bool:
+    """True if ``name`` is usable as a single path component (no separators, not . or ..)."""
+    # Both separators on every platform, so a manifest means the same everywhere
+    return name not in (".", "..") and not any(c in name for c in ("/", "\\", "\0"))
+
+
+def _render_client(
+    client: str,
+    data_dir: Path,
+    template_path: Path,
+    output_path: Path,
+    assets_dir: Path,
+    bytecode_cache_dir: Path | None,
+    validate: bool = True,
+) -> dict:
+    """Load and render one client's report (runs in a worker process)."""
+    from .loader import build_context
+    from .render import ensure_logo_in_output, render_to_file
+    from .validate import validate_dir
+
+    result = dict.fromkeys(SUMMARY_FIELDS, "")
+    result.update(client=client, status="ok", load_s=0.0, render_s=0.0, pdf_s=0.0)
+    try:
+        started = time.perf_counter()
+        if validate:
+            validate_dir(data_dir)
+        context = build_context(data_dir)
+        result["load_s"] = time.perf_counter() - started
+        started = time.perf_counter()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        render_to_file(template_path, context, output_path, bytecode_cache_dir)
+        ensure_logo_in_output(output_path, assets_dir)
+        result["render_s"] = time.perf_counter() - started
+        result["html"] = str(output_path)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_batch(
+    clients: list[tuple[str, Path]],
+    template_path: Path,
+    output_dir: Path,
+    assets_dir: Path,
+    pdf: bool = False,
+    workers: int | None = None,
+    pdf_concurrency: int = 4,
+    bytecode_cache_dir: Path | None = None,
+    validate: bool = True,
+) -> list[dict]:
+    """Render every client's report, then convert all of them to PDF in one browser.
+
+    Loading and rendering fan out across a process pool. Each client's output goes to
+    ``output_dir/<client>/``. Returns one summary dict per client (see SUMMARY_FIELDS);
+    a failing client is recorded and does not stop the others. With ``validate``, a
+    client whose CSVs fail :func:`irctc_report.validate.validate_dir` fails before rendering.
+    """
+    output_dir = Path(output_dir)
+    workers = workers or min(len(clients), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _render_client,
+                client,
+                data_dir,
+                template_path,
+                output_dir / client / REPORT_HTML_NAME,
+                assets_dir,
+                bytecode_cache_dir,
+                validate,
+            )
+            for client, data_dir in clients
+        ]
+        results = [f.result() for f in futures]
+
+    if pdf:
+        rendered = [r for r in results if r["status"] == "ok"]
+        if rendered:
+            from .pdf import convert_many
+
+            try:
+                pdf_results = convert_many([r["html"] for r in rendered], concurrency=pdf_concurrency)
+            except Exception as e:
+                for r in rendered:
+                    r["status"] = "pdf_failed"
+                    r["error"] = f"{type(e).__name__}: {e}"
+            else:
+                for r, pdf_result in zip(rendered, pdf_results):
+                    r["pdf_s"] = pdf_result.seconds
+                    if pdf_result.ok:
+                        r["pdf"] = str(pdf_result.pdf_path)
+                    else:
+                        r["status"] = "pdf_failed"
+                        r["error"] = pdf_result.error
+    return results
+
+
+def write_summary(results: list[dict], path: Path) -> None:
+    """Write the per-client summary as CSV (timings rounded to milliseconds)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        w.writeheader()
+        for r in results:
+            w.writerow({k: round(v, 3) if isinstance(v, float) else v for k, v in r.items()})
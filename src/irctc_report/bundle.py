@@ -0,0 +1,125 @@
+"""Build a self-contained report: vendored fonts and the logo inlined as data URIs."""
+
+import base64
+import html as html_lib
+import io
+import re
+from pathlib import Path
+
+# Fonts vendored under assets/fonts/ (family, weight range, style, file name).
+# bundle_html refuses to run without them: the bundle would silently fall back to
+# whatever system fonts the viewing machine has.
+FONT_FACES = [
+    ("DM Sans", "400 700", "normal", "DMSans-Variable.ttf"),
+    ("DM Sans", "400", "italic", "DMSans-Italic-Variable.ttf"),
+    ("JetBrains Mono", "400 500", "normal", "JetBrainsMono-Variable.ttf"),
+]
+
+_FONT_MIME = {".ttf": "font/ttf", ".otf": "font/otf", ".woff": "font/woff", ".woff2": "font/woff2"}
+
+# <link> tags pointing at Google Fonts (stylesheet and preconnect hints)
+_REMOTE_FONT_LINK = re.compile(
+    r"[ \t]*<link\b[^>]*\bhref=\"https://fonts\.(?:googleapis|gstatic)\.com[^\"]*\"[^>]*>[ \t]*\n?"
+)
+_LOGO_SRC = re.compile(r"""src=(["'])main_logo\.png\1""")
+_TAG = re.compile(r"<[^>]+>")
+_STYLE_OR_SCRIPT = re.compile(r"<(style|script)\b.*?</\1>", re.S | re.I)
+
+
+def _data_uri(data: bytes, mime: str) -> str:
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def _document_text(html: str) -> str:
+    """Characters that can actually be rendered: visible text plus printable ASCII."""
+    text = html_lib.unescape(_TAG.sub(" ", _STYLE_OR_SCRIPT.sub(" ", html)))
+    return text + "".join(chr(c) for c in range(0x20, 0x7F))
+
+
+def _subset_font(data: bytes, text: str) -> tuple[bytes, str] | None:
+    """Subset a font to the glyphs in ``text`` (needs fontTools). None if unavailable."""
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return None
+    try:
+        import brotli  # noqa: F401  (required by fontTools for woff2 output)
+
+        flavor, mime = "woff2", "font/woff2"
+    except ImportError:
+        flavor, mime = None, "font/ttf"
+    font = TTFont(io.BytesIO(data))
+    options = subset.Options()
+    options.flavor = flavor
+    options.layout_features = ["*"]
+    subsetter = subset.Subsetter(options=options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font.flavor = flavor
+    font.save(out)
+    return out.getvalue(), mime
+
+
+def missing_fonts(fonts_dir: Path) -> list[str]:
+    """File names from FONT_FACES that are not in ``fonts_dir``."""
+    return [filename for _, _, _, filename in FONT_FACES if not (Path(fonts_dir) / filename).exists()]
+
+
+def require_fonts(fonts_dir: Path) -> None:
+    """Raise FileNotFoundError naming the FONT_FACES files missing from ``fonts_dir``."""
+    missing = missing_fonts(fonts_dir)
+    if missing:
+        raise FileNotFoundError(f"Missing fonts in {fonts_dir}: {', '.join(missing)} (see README.md there)")
+
+
+def font_face_css(fonts_dir: Path, text: str | None = None) -> str:
+    """@font-face rules for the vendored fonts found in ``fonts_dir``, as data URIs.
+
+    If ``text`` is given and fontTools is installed, each font is subset to it.
+    """
+    rules = []
+    for family, weight, style, filename in FONT_FACES:
+        path = fonts_dir / filename
+        if not path.exists():
+            continue
+        data = path.read_bytes()
+        mime = _FONT_MIME.get(path.suffix.lower(), "application/octet-stream")
+        if text is not None:
+            subset = _subset_font(data, text)
+            if subset is not None:
+                data, mime = subset
+        rules.append(
+            "@font-face {\n"
+            f"  font-family: '{family}';\n"
+            f"  font-style: {style};\n"
+            f"  font-weight: {weight};\n"
+            f"  src: url({_data_uri(data, mime)});\n"
+            "}"
+        )
+    return "\n".join(rules)
+
+
+def bundle_html(html: str, assets_dir: Path, subset_fonts: bool = True) -> str:
+    """Return ``html`` as a single self-contained file.
+
+    Google Fonts links are replaced with inline @font-face rules for the fonts in
+    ``assets_dir/fonts`` and the logo is embedded, so the document needs no network
+    and no files next to it. Raises FileNotFoundError if a font is missing.
+    """
+    require_fonts(assets_dir / "fonts")
+    html = _REMOTE_FONT_LINK.sub("", html)
+    css = font_face_css(assets_dir / "fonts", _document_text(html) if subset_fonts else None)
+    if css:
+        html = html.replace("</head>", f"<style>\n{css}\n</style>\n</head>", 1)
+    return inline_logo(html, assets_dir)
+
+
+def inline_logo(html: str, assets_dir: Path) -> str:
+    """Embed ``assets_dir/main_logo.png`` as a data URI (unchanged if there is no logo)."""
+    logo = assets_dir / "main_logo.png"
+    if not logo.exists():
+        return html
+    logo_uri = _data_uri(logo.read_bytes(), "image/png")
+    return _LOGO_SRC.sub(lambda m: f'src="{logo_uri}"', html)
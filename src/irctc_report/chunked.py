@@ -0,0 +1,190 @@
+"""Large-report PDF mode: render big tables in chunks concurrently, then merge.
+
+Laying out tens of thousands of table rows in one Chromium document is slow and
+memory-hungry. In this mode the PDF has a different layout from the normal one: the
+main report keeps the first ``chunk_rows`` rows of each table (with a note pointing to
+the annex), and the remaining rows follow the whole report as annexes of
+``chunk_rows`` rows each, in table order. The HTML output is not affected.
+
+All documents, and then the running footer carrying continuous page numbers, are
+printed on one :class:`~irctc_report.pdf.PdfRenderer`, launched once; they are merged
+in order with pypdf. Row numbers (S.No) continue across chunks.
+"""
+
+import html as html_lib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .constants import COLUMN_HEADERS
+from .loader import TABLE_COLUMNS
+from .pdf import PDF_OPTIONS, PdfRenderer
+from .render import ensure_logo_in_output, render_html
+
+ANNEX_TEMPLATE_NAME = "IRCTC_Takedown_Report_annex.html"
+
+# Context key of each table, its title in the annex and its (key, header) columns
+LARGE_TABLES = [
+    (status, title, [(key, COLUMN_HEADERS[key]) for key in TABLE_COLUMNS[f"{status}.csv"]])
+    for status, title in (
+        ("taken_down", "Takedown Achievements – Closed & Verified"),
+        ("under_review", "Assets Under Review"),
+        ("in_progress", "Assets In Progress"),
+    )
+]
+
+# Leave room in the bottom margin for the stamped footer
+CHUNK_PDF_OPTIONS = {**PDF_OPTIONS, "margin": {**PDF_OPTIONS["margin"], "bottom": "36px"}}
+FOOTER_PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": False,
+    "margin": {"top": "0", "bottom": "0", "left": "0", "right": "0"},
+}
+
+_FOOTER_STYLE = """
+@page { size: A4; margin: 0; }
+html, body { margin: 0; padding: 0; background: transparent; }
+.page { position: relative; height: 296.8mm; overflow: hidden; break-after: page; }
+.page:last-child { break-after: auto; }
+.footer {
+  position: absolute; left: 6.5mm; right: 6.5mm; bottom: 3mm;
+  display: flex; justify-content: space-between;
+  font: 7pt -apple-system, sans-serif; color: #57606a;
+}
+"""
+
+
+def _require_pypdf():
+    try:
+        import pypdf
+    except ImportError:
+        raise RuntimeError("pypdf not installed (needed for large-report mode). Run: pip install pypdf") from None
+    return pypdf
+
+
+def split_context(context: dict, chunk_rows: int) -> tuple[dict, list[dict]]:
+    """Split ``context`` into the main report context and one context per annex chunk."""
+    main = dict(context)
+    continued = {}
+    annexes = []
+    for key, title, columns in LARGE_TABLES:
+        rows = context.get(f"{key}_rows") or []
+        if len(rows) <= chunk_rows:
+            continue
+        main[f"{key}_rows"] = rows[:chunk_rows]
+        continued[key] = {"shown": chunk_rows, "total": len(rows)}
+        for offset in range(chunk_rows, len(rows), chunk_rows):
+            annexes.append(
+                {
+                    "meta": context["meta"],
+                    "title": title,
+                    "columns": columns,
+                    "rows": rows[offset : offset + chunk_rows],
+                    "row_offset": offset,
+                    "total": len(rows),
+                }
+            )
+    main["continued"] = continued
+    return main, annexes
+
+
+def _footer_html(left_text: str, pages: int) -> str:
+    left = html_lib.escape(left_text)
+    body = "".join(
+        f'<div class="page"><div class="footer"><span>{left}</span>'
+        f"<span>Page {i} of {pages}</span></div></div>"
+        for i in range(1, pages + 1)
+    )
+    return f"<!DOCTYPE html><html><head><meta charset='UTF-8'><style>{_FOOTER_STYLE}</style></head><body>{body}</body></html>"
+
+
+def render_large_pdf(
+    template_path: Path,
+    context: dict,
+    pdf_path: Path,
+    assets_dir: Path,
+    chunk_rows: int = 500,
+    concurrency: int = 4,
+    bundle: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    renderer: PdfRenderer | None = None,
+) -> Path:
+    """Render the report to ``pdf_path`` in chunks (see module docstring). Returns the path.
+
+    The annex template is looked up next to ``template_path``. With ``bundle`` every
+    part is self-contained (see :func:`irctc_report.bundle.bundle_html`) and printed
+    offline. Parts are printed on ``renderer`` if given, otherwise on a renderer with
+    ``concurrency`` browsers that is closed afterwards.
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+    pypdf = _require_pypdf()
+    template_path = Path(template_path)
+    annex_template = template_path.parent / ANNEX_TEMPLATE_NAME
+    assets_dir = Path(assets_dir)
+    pdf_path = Path(pdf_path).resolve()
+    pdf_path.parent.mkdir(parents=True, exist_ok=True)
+    main_context, annexes = split_context(context, chunk_rows)
+
+    own_renderer = renderer is None
+    if own_renderer:
+        renderer = PdfRenderer(browsers=concurrency)
+    work_dir = Path(tempfile.mkdtemp(prefix=".chunks-", dir=pdf_path.parent))
+    try:
+        parts = [(template_path, main_context), *((annex_template, annex) for annex in annexes)]
+        html_paths = []
+        for i, (template, part_context) in enumerate(parts):
+            # Parts hold at most chunk_rows rows per table, so render in memory
+            html = render_html(template, part_context, bytecode_cache_dir)
+            if bundle:
+                from .bundle import bundle_html
+
+                html = bundle_html(html, assets_dir)
+            html_paths.append(work_dir / f"part-{i:04d}.html")
+            html_paths[-1].write_text(html, encoding="utf-8")
+        if not bundle:
+            ensure_logo_in_output(html_paths[0], assets_dir)
+
+        renderer.start()
+        with ThreadPoolExecutor(max_workers=renderer.browsers, thread_name_prefix="chunk-pdf") as pool:
+            futures = [
+                pool.submit(renderer.convert, path, offline=bundle, pdf_options=CHUNK_PDF_OPTIONS)
+                for path in html_paths
+            ]
+            pdf_paths = []
+            for path, future in zip(html_paths, futures):
+                try:
+                    pdf_paths.append(future.result())
+                except Exception as e:
+                    raise RuntimeError(f"PDF conversion failed for {path.name}: {e}") from e
+
+        writer = pypdf.PdfWriter()
+        for part_pdf in pdf_paths:
+            writer.append(str(part_pdf))
+        pages = len(writer.pages)
+
+        meta = context["meta"]
+        footer_path = work_dir / "footer.html"
+        footer_path.write_text(
+            _footer_html(
+                f"IRCTC – Takedown Status Report · {meta.get('prepared_by', '')} · {meta.get('report_date', '')}",
+                pages,
+            ),
+            encoding="utf-8",
+        )
+        try:
+            # Same warm browser; the footer has nothing to fetch
+            footer_pdf = renderer.convert(footer_path, offline=True, pdf_options=FOOTER_PDF_OPTIONS)
+        except Exception as e:
+            raise RuntimeError(f"PDF footer rendering failed: {e}") from e
+        footer_pages = pypdf.PdfReader(str(footer_pdf)).pages
+        for page, stamp in zip(writer.pages, footer_pages):
+            page.merge_page(stamp)
+        with open(pdf_path, "wb") as f:
+            writer.write(f)
+    finally:
+        if own_renderer:
+            renderer.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return pdf_path
@@ -0,0 +1,23 @@
+"""Command-line entry points: ``irctc-report <command>`` or ``python -m irctc_report.cli``.
+
+The commands read data/, templates/ and assets/ and write output/ under PROJECT_ROOT:
+the directory named by $IRCTC_REPORT_ROOT if set, else this source tree when running
+from a checkout (or an editable install), else the current directory. In a checkout,
+``python -m scripts <command>`` and ``python -m scripts.<name>`` run the same modules.
+"""
+
+import os
+from pathlib import Path
+
+
+def _project_root() -> Path:
+    if os.environ.get("IRCTC_REPORT_ROOT"):
+        return Path(os.environ["IRCTC_REPORT_ROOT"]).resolve()
+    # src/irctc_report/cli -> the project tree, if this is one
+    tree = Path(__file__).resolve().parents[3]
+    if (tree / "templates").is_dir():
+        return tree
+    return Path.cwd()
+
+
+PROJECT_ROOT = _project_root()
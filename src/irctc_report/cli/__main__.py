@@ -0,0 +1,54 @@
+"""
+Single entry point for the report tools: ``irctc-report <command> [options]`` once
+installed, or ``python -m irctc_report.cli`` / ``python -m scripts`` from a checkout.
+
+Only the chosen command's module is imported, so e.g. ``generate`` without --pdf never
+loads Playwright and nothing but ``serve`` loads Flask. Run ``<command> --help`` for
+its options.
+"""
+
+import importlib
+import os
+import sys
+
+# Command -> (module with main(), summary)
+COMMANDS = {
+    "generate": ("irctc_report.cli.generate_report", "Generate the report (HTML, optionally PDF/JSON/CSV) from CSV data"),
+    "pdf": ("irctc_report.cli.to_pdf", "Convert HTML files to PDF"),
+    "auto": ("irctc_report.cli.automate_report", "Set today's date and regenerate HTML + PDF (cron, --watch)"),
+    "serve": ("irctc_report.cli.app_upload", "Run the CSV upload web app"),
+}
+
+
+def prog() -> str:
+    """How the user invoked us: ``python -m <package>`` or the console script's name."""
+    name = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else ""
+    if name not in ("", "__main__.py", "-c"):
+        return name
+    spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+    return f"python -m {spec.parent if spec is not None else __package__}"
+
+
+def usage() -> str:
+    lines = [f"usage: {prog()} <command> [options]", "", "commands:"]
+    lines += [f"  {name:<10}{summary}" for name, (_, summary) in COMMANDS.items()]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        sys.exit(0 if argv else 2)
+    command, *rest = argv
+    if command not in COMMANDS:
+        print(f"{usage()}\n\nerror: unknown command {command!r}", file=sys.stderr)
+        sys.exit(2)
+    module = importlib.import_module(COMMANDS[command][0])
+    # Each command parses sys.argv itself; make its usage line read "<prog> <command>"
+    sys.argv = [f"{prog()} {command}", *rest]
+    module.main()
+
+
+if __name__ == "__main__":
+    main()
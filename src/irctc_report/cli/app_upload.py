@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Web app: upload CSV files to generate the IRCTC Takedown Report (HTML and optional PDF).
+
+Run from project root: python -m scripts.app_upload
+Open: http://127.0.0.1:5000 or http://<your-ip>:5000 (hosted on 0.0.0.0)
+"""
+
+import atexit
+import os
+import sys
+import threading
+from pathlib import Path
+
+from irctc_report.cli import PROJECT_ROOT
+
+try:
+    from flask import Flask, Response, abort, jsonify, request, send_file, render_template_string, redirect, url_for
+except ImportError:
+    print("Install Flask: pip install flask")
+    sys.exit(1)
+
+from irctc_report import PdfRenderer, build_context_from_streams, metrics, render_to_file, convert_to_pdf
+from irctc_report.compress import file_etag, precompress, variant_for
+from irctc_report.jobs import DONE, FAILED, Job, JobQueue, QueueFull
+from irctc_report.manifest import PACKAGE_DIR, hash_inputs
+from irctc_report.render import ensure_logo_in_output
+from irctc_report.result_cache import ResultCache, cache_key, hash_stream
+from irctc_report.validate import SchemaError, validate_streams
+
+TEMPLATE_PATH = PROJECT_ROOT / "templates" / "IRCTC_Takedown_Report_template.html"
+OUTPUT_DIR = PROJECT_ROOT / "output"
+JOBS_DIR = OUTPUT_DIR / "jobs"
+CACHE_DIR = OUTPUT_DIR / "cache"
+OUTPUT_HTML_NAME = "IRCTC_Takedown_Report_generated.html"
+OUTPUT_PDF_NAME = "IRCTC_Takedown_Report_generated.pdf"
+ASSETS_DIR = PROJECT_ROOT / "assets"
+UPLOAD_FIELDS = [
+    ("report_meta", "report_meta.csv"),
+    ("taken_down", "taken_down.csv"),
+    ("under_review", "under_review.csv"),
+    ("in_progress", "in_progress.csv"),
+]
+
+# Worker threads generating reports, and how many more uploads may wait for one
+JOB_WORKERS = int(os.environ.get("REPORT_JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.environ.get("REPORT_JOB_QUEUE_SIZE", "8"))
+# Result cache bounds: total size and time since an entry was last used
+CACHE_MAX_MB = int(os.environ.get("REPORT_CACHE_MAX_MB", "512"))
+CACHE_MAX_AGE_HOURS = float(os.environ.get("REPORT_CACHE_MAX_AGE_HOURS", "168"))
+
+app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = 8 * 1024 * 1024  # 8 MB
+
+jobs = JobQueue(JOBS_DIR, workers=JOB_WORKERS, max_queued=JOB_QUEUE_SIZE)
+# One warm browser per job worker, so concurrent PDF jobs do not wait on each other
+pdf_renderer = PdfRenderer(browsers=JOB_WORKERS)
+atexit.register(pdf_renderer.close)
+# Identical uploads (same files, template and code) reuse earlier HTML/PDF
+result_cache = ResultCache(CACHE_DIR, max_bytes=CACHE_MAX_MB * 1024 * 1024, max_age=CACHE_MAX_AGE_HOURS * 3600)
+
+UPLOAD_PAGE = """
+<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="UTF-8">
+  {% if job and job.pending %}<meta http-equiv="refresh" content="2">{% endif %}
+  <title>IRCTC Report – CSV Upload</title>
+  <style>
+    body { font-family: system-ui, sans-serif; max-width: 560px; margin: 2rem auto; padding: 0 1rem; }
+    h1 { font-size: 1.25rem; }
+    .field { margin-bottom: 1rem; }
+    label { display: block; font-weight: 600; margin-bottom: 0.25rem; }
+    .hint { font-size: 0.875rem; color: #57606a; margin-top: 0.25rem; }
+    input[type=file] { width: 100%; }
+    button { background: #cf222e; color: #fff; border: none; padding: 0.5rem 1rem; border-radius: 6px; cursor: pointer; font-size: 1rem; }
+    button:hover { background: #a91c26; }
+    .cb { margin: 1rem 0; }
+    .cb label { font-weight: normal; display: inline; }
+    .error { background: #ffebe9; color: #cf222e; padding: 0.75rem; border-radius: 6px; margin-bottom: 1rem; white-space: pre-line; }
+    .success { background: #dafbe1; color: #1a7f37; padding: 0.75rem; border-radius: 6px; margin-bottom: 1rem; }
+    .pending { background: #fff8c5; color: #7d4e00; padding: 0.75rem; border-radius: 6px; margin-bottom: 1rem; }
+    .links { margin-top: 1rem; }
+    .links a { margin-right: 1rem; color: #0969da; }
+  </style>
+</head>
+<body>
+  <h1>IRCTC Takedown Report – Generate from CSV</h1>
+  {% if error %}
+  <div class="error">{{ error }}</div>
+  {% endif %}
+  {% if job %}
+  {% if job.pending %}
+  <div class="pending">Report is {{ job.status }}… this page refreshes automatically.</div>
+  {% elif job.status == 'failed' %}
+  <div class="error">{{ job.error }}</div>
+  {% else %}
+  <div class="success">{% if job.pdf_error %}HTML generated. PDF failed: {{ job.pdf_error }}{% else %}Report generated. Download HTML or PDF below.{% endif %}</div>
+  <div class="links">
+    <a href="{{ url_for('download_html', job_id=job.id) }}">Download HTML</a>
+    {% if job.pdf_path %}
+    <a href="{{ url_for('download_pdf', job_id=job.id) }}">Download PDF</a>
+    {% endif %}
+  </div>
+  {% endif %}
+  <p class="hint"><a href="{{ url_for('index') }}">Generate another report</a></p>
+  {% else %}
+  <form method="post" enctype="multipart/form-data" action="{{ url_for('upload') }}">
+    <div class="field">
+      <label for="report_meta">report_meta.csv (required)</label>
+      <input type="file" name="report_meta" id="report_meta" accept=".csv" required>
+      <div class="hint">report_date, prepared_by, reporting_window, newly_completed_domain, newly_under_review_domain, reactivated_domains, threat_severity, dominant_threat_type, risk_exposure, closing_note</div>
+    </div>
+    <div class="field">
+      <label for="taken_down">taken_down.csv</label>
+      <input type="file" name="taken_down" id="taken_down" accept=".csv">
+      <div class="hint">domain_url, reported_on, last_updated, threat_category, remarks</div>
+    </div>
+    <div class="field">
+      <label for="under_review">under_review.csv</label>
+      <input type="file" name="under_review" id="under_review" accept=".csv">
+      <div class="hint">domain_url, reported_on, threat_category, remarks</div>
+    </div>
+    <div class="field">
+      <label for="in_progress">in_progress.csv</label>
+      <input type="file" name="in_progress" id="in_progress" accept=".csv">
+      <div class="hint">domain_url, reported_on, threat_category, remarks</div>
+    </div>
+    <div class="cb">
+      <input type="checkbox" name="also_pdf" id="also_pdf" value="1">
+      <label for="also_pdf">Also generate PDF (requires Playwright)</label>
+    </div>
+    <button type="submit">Generate Report</button>
+  </form>
+  {% endif %}
+  <p class="hint" style="margin-top: 2rem;">Threat category values: Phishing Website, Typosquatted Domain, Fake Mobile App. reactivated_domains in meta: semicolon-separated list.</p>
+</body>
+</html>
+"""
+
+_VERSION_ROOTS = [TEMPLATE_PATH.parent, ASSETS_DIR, PACKAGE_DIR]
+_version: tuple[tuple, dict] | None = None
+_version_lock = threading.Lock()
+
+
+def _tree_signature(roots: list[Path]) -> tuple:
+    """(path, mtime, size) of every directory and file under ``roots``: stat calls only."""
+    signature = []
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+            for name in ["", *sorted(filenames)]:
+                st = os.stat(os.path.join(dirpath, name))
+                signature.append((dirpath, name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _template_version() -> dict:
+    """Hashes of everything besides the uploads that the output depends on.
+
+    Re-hashed only when a file in those trees is added, removed or modified, so an
+    upload normally costs a stat per file instead of reading them all.
+    """
+    global _version
+    signature = _tree_signature(_VERSION_ROOTS)
+    with _version_lock:
+        if _version is None or _version[0] != signature:
+            _version = (signature, hash_inputs(_VERSION_ROOTS, PROJECT_ROOT))
+        return _version[1]
+
+
+def _generate(job: Job, context: dict, also_pdf: bool, key: str) -> None:
+    """Job task: render the report (and optional PDF) into the job's directory and cache it."""
+    html_path = job.output_dir / OUTPUT_HTML_NAME
+    try:
+        render_to_file(TEMPLATE_PATH, context, html_path)
+        ensure_logo_in_output(html_path, ASSETS_DIR)
+        files = [html_path, html_path.parent / "main_logo.png", *precompress(html_path)]
+        job.html_path = html_path
+        if also_pdf:
+            try:
+                job.pdf_path = convert_to_pdf(html_path, renderer=pdf_renderer)
+                files += [job.pdf_path, *precompress(job.pdf_path)]
+            except Exception as e:
+                job.pdf_error = str(e)
+    except Exception:
+        metrics.add("jobs", status=FAILED)
+        raise
+    _store(key, [f for f in files if f.exists()])
+    _record_outcome(job)
+
+
+def _generate_pdf(job: Job, key: str) -> None:
+    """Job task: the cached HTML is already in the job's directory; convert it to PDF (and cache the PDF)."""
+    job.html_path = job.output_dir / OUTPUT_HTML_NAME
+    try:
+        job.pdf_path = pdf_renderer.convert(job.html_path, job.output_dir / OUTPUT_PDF_NAME)
+    except Exception as e:
+        job.pdf_error = str(e)
+    else:
+        _store(key, [job.pdf_path, *precompress(job.pdf_path)])
+    _record_outcome(job)
+
+
+def _record_outcome(job: Job) -> None:
+    """Count a finished job once: done, or pdf_failed when only its PDF failed (failed is
+    counted where the job raises)."""
+    metrics.add("jobs", status="pdf_failed" if job.pdf_error else DONE)
+
+
+def _store(key: str, files: list[Path]) -> None:
+    """Add a job's files to the result cache; the job's outputs are complete either way."""
+    try:
+        result_cache.put(key, files)
+    except OSError as e:
+        print(f"Warning: could not cache result {key[:12]}: {e}", file=sys.stderr)
+
+
+def _use_cached(job: Job, entry: Path) -> None:
+    # Links of the job's own, so evicting the entry does not remove its downloads
+    result_cache.export(entry, job.output_dir)
+    job.html_path = job.output_dir / OUTPUT_HTML_NAME
+    pdf_path = job.output_dir / OUTPUT_PDF_NAME
+    job.pdf_path = pdf_path if pdf_path.exists() else None
+    _record_outcome(job)
+
+
+def _render_page(status: int = 200, **kwargs):
+    kwargs.setdefault("error", None)
+    kwargs.setdefault("job", None)
+    return render_template_string(UPLOAD_PAGE, **kwargs), status
+
+
+def _queue_full(e: QueueFull):
+    metrics.add("jobs", status="rejected")
+    page, status = _render_page(429, error=str(e))
+    return page, status, {"Retry-After": "5"}
+
+
+@app.route("/")
+def index():
+    job = jobs.get(request.args.get("job", ""))
+    return _render_page(error=request.args.get("error"), job=job)
+
+
+@app.route("/upload", methods=["POST"])
+def upload():
+    report_meta = request.files.get("report_meta")
+    if not report_meta or not report_meta.filename:
+        return redirect(url_for("index", error="report_meta.csv is required"))
+    if not TEMPLATE_PATH.exists():
+        return redirect(url_for("index", error=f"Template not found: {TEMPLATE_PATH}"))
+    also_pdf = bool(request.form.get("also_pdf"))
+    # Parse the uploads straight from the request streams (they are only valid during
+    # this request); the job only renders.
+    streams = {}
+    for field, name in UPLOAD_FIELDS:
+        f = request.files.get(field)
+        if f and f.filename:
+            streams[name] = f.stream
+    key = cache_key({name: hash_stream(s) for name, s in streams.items()}, _template_version())
+    entry = result_cache.lookup(key)
+    if entry is not None and (entry / OUTPUT_HTML_NAME).exists():
+        # An entry evicted since the lookup (FileNotFoundError) is generated afresh
+        if not also_pdf or (entry / OUTPUT_PDF_NAME).exists():
+            try:
+                job = jobs.complete(lambda job: _use_cached(job, entry))
+            except FileNotFoundError:
+                pass
+            else:
+                metrics.add("result_cache", result="hit")
+                return redirect(url_for("index", job=job.id), code=303)
+        else:
+            try:
+                job = jobs.reserve()
+            except QueueFull as e:
+                return _queue_full(e)
+            try:
+                result_cache.export(entry, job.output_dir)
+            except FileNotFoundError:
+                jobs.cancel(job)
+            else:
+                metrics.add("result_cache", result="html_hit")
+                jobs.start(job, lambda job: _generate_pdf(job, key))
+                return redirect(url_for("index", job=job.id), code=303)
+    metrics.add("result_cache", result="miss")
+    try:
+        validate_streams(streams)
+    except SchemaError as e:
+        # Every problem with file and line; rejected before any job is queued
+        return _render_page(400, error=str(e))
+    try:
+        context = build_context_from_streams(streams)
+    except (FileNotFoundError, ValueError, UnicodeDecodeError) as e:
+        return redirect(url_for("index", error=str(e)))
+    try:
+        job = jobs.submit(lambda job: _generate(job, context, also_pdf, key))
+    except QueueFull as e:
+        return _queue_full(e)
+    return redirect(url_for("index", job=job.id), code=303)
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Stage latency histograms and counters in Prometheus text format."""
+    return Response(metrics.REGISTRY.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/jobs/<job_id>")
+def job_status(job_id):
+    job = jobs.get(job_id)
+    if job is None:
+        abort(404)
+    return jsonify(job.to_dict())
+
+
+def _finished_job(job_id) -> Job:
+    job = jobs.get(job_id)
+    if job is None:
+        abort(404)
+    if job.status != DONE:
+        abort(409)
+    return job
+
+
+def _send_artifact(path: Path, mimetype: str):
+    """Send a generated file, precompressed if the client accepts it, with conditional GET.
+
+    The ETag is the content hash of the bytes sent, so each encoding has its own;
+    If-None-Match / If-Modified-Since get a 304 from send_file.
+    """
+    variant, encoding = variant_for(path, lambda e: request.accept_encodings[e] > 0)
+    response = send_file(
+        variant,
+        as_attachment=True,
+        download_name=path.name,
+        mimetype=mimetype,
+        etag=file_etag(variant),
+        last_modified=path.stat().st_mtime,
+        conditional=True,
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+@app.route("/download/<job_id>/html")
+def download_html(job_id):
+    job = _finished_job(job_id)
+    if job.html_path and job.html_path.exists():
+        return _send_artifact(job.html_path, "text/html")
+    return redirect(url_for("index", error="No report generated yet."))
+
+
+@app.route("/download/<job_id>/pdf")
+def download_pdf(job_id):
+    job = _finished_job(job_id)
+    if job.pdf_path and job.pdf_path.exists():
+        return _send_artifact(job.pdf_path, "application/pdf")
+    return redirect(url_for("index", error="No PDF generated. Run again with “Also generate PDF” checked."))
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Web app: upload CSVs, download the generated report.")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to listen on (default: all)")
+    parser.add_argument("--port", type=int, default=5000, help="Port (default 5000)")
+    parser.add_argument("--no-debug", action="store_true", help="Disable the Flask debugger and reloader")
+    args = parser.parse_args()
+    app.run(host=args.host, port=args.port, debug=not args.no_debug)
+
+
+if __name__ == "__main__":
+    main()
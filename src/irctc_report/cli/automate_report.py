@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Fully automated report: optionally set report_date to today, then generate HTML + PDF.
+
+Suitable for cron. Example:
+  0 9 * * * cd /path/to/REPORT && .venv/bin/python -m scripts.automate_report >> report_cron.log 2>&1
+
+Or run it as a long-lived process that regenerates whenever data/, templates/ or
+assets/ change:
+  python -m scripts.automate_report --watch [--debounce 1.0] [--poll]
+"""
+
+import argparse
+import csv
+import sys
+from datetime import datetime
+
+from irctc_report.cli import PROJECT_ROOT
+
+DATA_DIR = PROJECT_ROOT / "data"
+META_CSV = DATA_DIR / "report_meta.csv"
+TEMPLATE_PATH = PROJECT_ROOT / "templates" / "IRCTC_Takedown_Report_template.html"
+OUTPUT_HTML = PROJECT_ROOT / "output" / "IRCTC_Takedown_Report_generated.html"
+ASSETS_DIR = PROJECT_ROOT / "assets"
+BYTECODE_CACHE_DIR = PROJECT_ROOT / "output" / ".jinja_cache"
+MANIFEST_PATH = PROJECT_ROOT / "output" / ".build_manifest.json"
+HISTORY_DB = PROJECT_ROOT / "output" / "report_history.sqlite3"
+TABLE_CACHE_DIR = PROJECT_ROOT / "output" / ".table_cache"
+
+
+def update_report_date_to_today() -> None:
+    if not META_CSV.exists():
+        return
+    today = datetime.now().strftime("%d %B %Y")
+    with open(META_CSV, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        fieldnames = reader.fieldnames
+    if not rows or "report_date" not in (fieldnames or []):
+        return
+    if all(row["report_date"] == today for row in rows):
+        # Leave the file (and its hash in the build manifest) untouched
+        return
+    for row in rows:
+        row["report_date"] = today
+    with open(META_CSV, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames)
+        w.writeheader()
+        w.writerows(rows)
+
+
+def generate(
+    bundle: bool = False,
+    html_only: bool = False,
+    force: bool = False,
+    history: bool = True,
+    cache: dict | None = None,
+) -> int:
+    """Render HTML (and PDF) unless the build manifest shows they are up to date.
+
+    ``cache`` (watch mode) keeps the loaded context between calls; it is reused while
+    the files in data/ are unchanged, e.g. when only the template was edited.
+    Returns a process exit code.
+    """
+    from irctc_report import build_context, render_html, render_to_file, convert_to_pdf
+    from irctc_report import manifest as build_manifest
+    from irctc_report.domains import domain_warnings
+    from irctc_report.render import ensure_logo_in_output
+    from irctc_report.validate import validate_dir
+
+    manifest = {} if force else build_manifest.load_manifest(MANIFEST_PATH)
+    html_key = {
+        "inputs": build_manifest.hash_inputs(
+            # The whole templates dir: the report template includes partials
+            [DATA_DIR, TEMPLATE_PATH.parent, ASSETS_DIR, build_manifest.PACKAGE_DIR], PROJECT_ROOT
+        ),
+        "bundle": bundle,
+    }
+    data_key = {k: v for k, v in html_key["inputs"].items() if k.startswith(f"{DATA_DIR.name}/")}
+
+    OUTPUT_HTML.parent.mkdir(parents=True, exist_ok=True)
+    if build_manifest.is_up_to_date(manifest, "html", html_key, OUTPUT_HTML):
+        if not bundle:
+            ensure_logo_in_output(OUTPUT_HTML, ASSETS_DIR)
+        print(f"HTML up to date: {OUTPUT_HTML}")
+    else:
+        if cache is not None and cache.get("data_key") == data_key:
+            context = cache["context"]
+        else:
+            try:
+                validate_dir(DATA_DIR, cache_dir=TABLE_CACHE_DIR)
+                context = build_context(
+                    DATA_DIR, history_db=HISTORY_DB if history else None, table_cache_dir=TABLE_CACHE_DIR
+                )
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+            for warning in domain_warnings(context):
+                print(f"Warning: {warning}", file=sys.stderr)
+            if cache is not None:
+                cache.update(data_key=data_key, context=context)
+        if bundle:
+            from irctc_report.bundle import bundle_html
+
+            html = render_html(TEMPLATE_PATH, context, BYTECODE_CACHE_DIR)
+            OUTPUT_HTML.write_text(bundle_html(html, ASSETS_DIR), encoding="utf-8")
+        else:
+            render_to_file(TEMPLATE_PATH, context, OUTPUT_HTML, BYTECODE_CACHE_DIR)
+            ensure_logo_in_output(OUTPUT_HTML, ASSETS_DIR)
+        build_manifest.record(manifest, "html", html_key, OUTPUT_HTML)
+        build_manifest.save_manifest(MANIFEST_PATH, manifest)
+        print(f"HTML saved: {OUTPUT_HTML}")
+
+    if not html_only:
+        pdf_path = OUTPUT_HTML.with_suffix(".pdf")
+        # The PDF depends only on the HTML (and the logo it loads) and the load policy
+        pdf_key = {
+            "html": manifest["html"]["output"],
+            "inputs": build_manifest.hash_inputs([ASSETS_DIR], PROJECT_ROOT),
+            "offline": bundle,
+        }
+        if build_manifest.is_up_to_date(manifest, "pdf", pdf_key, pdf_path):
+            print(f"PDF up to date: {pdf_path}")
+        else:
+            try:
+                pdf_path = convert_to_pdf(OUTPUT_HTML, offline=bundle)
+            except Exception as e:
+                print(f"PDF conversion failed: {e}", file=sys.stderr)
+                return 1
+            build_manifest.record(manifest, "pdf", pdf_key, pdf_path)
+            build_manifest.save_manifest(MANIFEST_PATH, manifest)
+            print(f"PDF saved: {pdf_path}")
+    return 0
+
+
+def watch(args) -> None:
+    """Regenerate on every (debounced) change until interrupted.
+
+    The process stays up, so the Jinja environment, the loaded context (while data/ is
+    unchanged) and the PDF browser are reused between runs; the build manifest still
+    skips outputs a change does not affect.
+    """
+    from irctc_report import metrics
+    from irctc_report.watch import Watcher, changes
+
+    cache = {}
+
+    def run_once(reason: str, force: bool = False) -> None:
+        if not args.no_update_date:
+            update_report_date_to_today()
+        with metrics.record_run() as run:
+            try:
+                code = generate(
+                    bundle=args.bundle,
+                    html_only=args.html_only,
+                    force=force,
+                    history=not args.no_history,
+                    cache=cache,
+                )
+            except Exception as e:
+                # Keep watching: the next change may fix it
+                print(f"Error: {e}", file=sys.stderr)
+                code = 1
+        print(f"[{datetime.now().isoformat(timespec='seconds')}] {reason} {run.log_line()} exit={code}", flush=True)
+
+    # Start watching before the first run so edits made during it are not missed
+    with Watcher([DATA_DIR, TEMPLATE_PATH.parent, ASSETS_DIR], poll=args.poll) as watcher:
+        print(f"Watching data/, templates/ and assets/ ({watcher.backend}); Ctrl+C to stop", flush=True)
+        run_once("start", force=args.force)
+        try:
+            for batch in changes(watcher, args.debounce):
+                names = ",".join(sorted(p.relative_to(PROJECT_ROOT).as_posix() for p in batch))
+                run_once(f"changed={names}")
+        except KeyboardInterrupt:
+            pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--no-update-date", action="store_true", help="Do not set report_date to today")
+    parser.add_argument("--html-only", action="store_true", help="Generate HTML only, skip PDF")
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Self-contained HTML (fonts and logo inlined); PDF renders without network",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild HTML and PDF even if the build manifest says they are up to date",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record this run in the snapshot history (output/report_history.sqlite3)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate when data/, templates/ or assets/ change",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=1.0,
+        help="Watch mode: seconds without further changes before regenerating (default 1.0)",
+    )
+    parser.add_argument("--poll", action="store_true", help="Watch mode: poll for changes instead of inotify")
+    args = parser.parse_args()
+
+    if args.bundle:
+        from irctc_report.bundle import require_fonts
+
+        try:
+            require_fonts(ASSETS_DIR / "fonts")
+        except FileNotFoundError as e:
+            print(f"Error: --bundle: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.watch:
+        watch(args)
+        return
+
+    if not args.no_update_date:
+        update_report_date_to_today()
+
+    from irctc_report import metrics
+
+    with metrics.record_run() as run:
+        code = generate(
+            bundle=args.bundle, html_only=args.html_only, force=args.force, history=not args.no_history
+        )
+    print(f"[{datetime.now().isoformat(timespec='seconds')}] {run.log_line()} exit={code}")
+    if code:
+        sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
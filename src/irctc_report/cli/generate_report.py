@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Generate IRCTC Takedown Report HTML from CSV data; optionally convert to PDF.
+
+Usage:
+  python -m scripts.generate_report [--data-dir data] [--output output/report.html] [--pdf] [--bundle]
+  python -m scripts.generate_report --template a.html --template b.html [--json] [--csv-summary] [--pdf]
+  python -m scripts.generate_report --batch clients/ [--output-dir output/batch] [--workers N] [--pdf]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from irctc_report.cli import PROJECT_ROOT
+
+from irctc_report.pdf import DEFAULT_PDF_ENGINE, PDF_ENGINES
+from irctc_report.render import ensure_logo_in_output
+from irctc_report.validate import validate_dir
+
+
+def run_batch_mode(args, template_path: Path) -> None:
+    from irctc_report.batch import discover_clients, run_batch, write_summary
+
+    try:
+        clients = discover_clients(args.batch.resolve())
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not clients:
+        print(f"Error: no client data directories found in {args.batch}", file=sys.stderr)
+        sys.exit(1)
+    output_dir = args.output_dir.resolve()
+    results = run_batch(
+        clients,
+        template_path,
+        output_dir,
+        args.assets_dir.resolve(),
+        pdf=args.pdf,
+        workers=args.workers,
+        bytecode_cache_dir=args.bytecode_cache or output_dir / ".jinja_cache",
+        validate=not args.no_validate,
+    )
+    summary_path = output_dir / "batch_summary.csv"
+    write_summary(results, summary_path)
+    failed = [r for r in results if r["status"] != "ok"]
+    for r in results:
+        line = f"{r['client']}: {r['status']} (load {r['load_s']:.3f}s, render {r['render_s']:.3f}s"
+        line += f", pdf {r['pdf_s']:.3f}s)" if args.pdf else ")"
+        if r["error"]:
+            line += f" - {r['error']}"
+        print(line, file=sys.stderr if r["status"] != "ok" else sys.stdout)
+    print(f"{len(results) - len(failed)}/{len(results)} clients OK. Summary: {summary_path}")
+    if failed:
+        sys.exit(1)
+
+
+def run_pipeline_mode(args, data_dir: Path, template_path: Path, output_path: Path) -> None:
+    from irctc_report.domains import domain_warnings
+    from irctc_report.pipeline import run_pipeline
+
+    try:
+        if not args.no_validate:
+            validate_dir(data_dir, cache_dir=args.table_cache)
+        result = run_pipeline(
+            data_dir,
+            template_path,
+            output_path,
+            args.assets_dir.resolve(),
+            pdf=args.pdf,
+            bundle=args.bundle,
+            bytecode_cache_dir=args.bytecode_cache,
+            history_db=args.history_db,
+            table_cache_dir=args.table_cache,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    for warning in domain_warnings(result.context):
+        print(f"Warning: {warning}", file=sys.stderr)
+    print(f"HTML saved: {result.html_path}")
+    if result.pdf_error:
+        print(f"PDF conversion failed: {result.pdf_error}", file=sys.stderr)
+        sys.exit(1)
+    if result.pdf_path:
+        print(f"PDF saved: {result.pdf_path}")
+
+
+def run_fan_out(args, context: dict, templates: list[Path], output_path: Path) -> None:
+    """Render the loaded context through every template, plus the JSON/CSV exports."""
+    from irctc_report.fanout import fan_out, output_name
+
+    # The first template keeps --output; the others go next to it, named after the template
+    outputs = [(templates[0], output_path)]
+    outputs += [(t, output_path.with_name(output_name(t))) for t in templates[1:]]
+    if len({path for _, path in outputs}) != len(outputs):
+        print("Error: two templates would write the same output file; rename one", file=sys.stderr)
+        sys.exit(1)
+    artifacts = fan_out(
+        context,
+        outputs,
+        args.assets_dir.resolve(),
+        pdf=args.pdf,
+        json_path=output_path.with_suffix(".json") if args.json else None,
+        csv_path=output_path.with_name(f"{output_path.stem}_summary.csv") if args.csv_summary else None,
+        bundle=args.bundle,
+        bytecode_cache_dir=args.bytecode_cache,
+        pdf_engine=args.pdf_engine,
+    )
+    for artifact in artifacts:
+        if artifact.error:
+            print(f"{artifact.kind.upper()} failed ({artifact.path}): {artifact.error}", file=sys.stderr)
+        else:
+            print(f"{artifact.kind.upper()} saved: {artifact.path}")
+    if any(artifact.error for artifact in artifacts):
+        sys.exit(1)
+
+
+def main() -> None:
+    default_data = PROJECT_ROOT / "data"
+    default_template = PROJECT_ROOT / "templates" / "IRCTC_Takedown_Report_template.html"
+    default_output = PROJECT_ROOT / "output" / "IRCTC_Takedown_Report_generated.html"
+    assets_dir = PROJECT_ROOT / "assets"
+
+    parser = argparse.ArgumentParser(
+        description="Generate IRCTC Takedown Report HTML from CSV data; optionally convert to PDF.",
+    )
+    parser.add_argument("--data-dir", type=Path, default=default_data, help="Directory with report CSVs")
+    parser.add_argument(
+        "--template",
+        type=Path,
+        action="append",
+        default=None,
+        help="Jinja2 template path; repeat to render one loaded dataset through several templates",
+    )
+    parser.add_argument("--output", type=Path, default=default_output, help="Output HTML path")
+    parser.add_argument("--pdf", action="store_true", help="Also convert to PDF")
+    parser.add_argument("--assets-dir", type=Path, default=assets_dir, help="Assets (e.g. logo) directory")
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Write a single self-contained HTML (fonts and logo inlined); PDF renders offline",
+    )
+    parser.add_argument(
+        "--bytecode-cache",
+        type=Path,
+        default=None,
+        help="Directory for compiled-template cache (speeds up cold runs)",
+    )
+    parser.add_argument(
+        "--table-cache",
+        type=Path,
+        default=None,
+        help="Directory for parsed-table cache (unchanged or appended-to CSVs load without re-parsing)",
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        help="Directory of client data dirs, or CSV manifest (client,data_dir): one report per client",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=PROJECT_ROOT / "output" / "batch",
+        help="Batch mode: reports go to <output-dir>/<client>/",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Batch mode: worker processes")
+    parser.add_argument(
+        "--large-report",
+        action="store_true",
+        help="With --pdf: render big tables in chunks concurrently and merge (needs pypdf)",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=500,
+        help="Large-report mode: table rows per chunk (default 500)",
+    )
+    parser.add_argument(
+        "--pdf-engine",
+        choices=sorted(PDF_ENGINES),
+        default=DEFAULT_PDF_ENGINE,
+        help="PDF engine: chromium (default, exact print of the HTML) or reportlab (no browser, much lighter)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap CSV loading, template compilation and browser launch; PDF is rendered from memory",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Also write a machine-readable JSON export (<output>.json) of the loaded data and statistics",
+    )
+    parser.add_argument(
+        "--csv-summary",
+        action="store_true",
+        help="Also write the headline numbers as CSV (<output stem>_summary.csv)",
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip the up-front CSV check (headers, dates, threat categories, duplicate domains)",
+    )
+    parser.add_argument(
+        "--history-db",
+        type=Path,
+        default=None,
+        help="SQLite snapshot history: record this run and fill empty newly_*/reactivated meta from the deltas",
+    )
+    args = parser.parse_args()
+
+    data_dir = args.data_dir.resolve()
+    templates = [t.resolve() for t in args.template or [default_template]]
+    template_path = templates[0]
+    output_path = args.output.resolve()
+
+    for template in templates:
+        if not template.exists():
+            print(f"Error: template not found: {template}", file=sys.stderr)
+            sys.exit(1)
+    if args.bundle:
+        from irctc_report.bundle import require_fonts
+
+        try:
+            require_fonts(args.assets_dir.resolve() / "fonts")
+        except FileNotFoundError as e:
+            print(f"Error: --bundle: {e}", file=sys.stderr)
+            sys.exit(1)
+    fan_out = len(templates) > 1 or args.json or args.csv_summary
+    if fan_out and (args.batch is not None or args.pipeline or args.large_report):
+        print(
+            "Error: several --template, --json and --csv-summary do not combine with --batch, --pipeline"
+            " or --large-report",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    if args.batch is not None:
+        # run_batch renders every client with the defaults; refuse options it would ignore
+        ignored = [
+            flag
+            for flag, given in (
+                ("--pdf-engine", args.pdf_engine != DEFAULT_PDF_ENGINE),
+                ("--bundle", args.bundle),
+                ("--large-report", args.large_report),
+                ("--pipeline", args.pipeline),
+                ("--history-db", args.history_db is not None),
+                ("--table-cache", args.table_cache is not None),
+            )
+            if given
+        ]
+        if ignored:
+            print(f"Error: --batch does not support {', '.join(ignored)}", file=sys.stderr)
+            sys.exit(1)
+        run_batch_mode(args, template_path)
+        return
+    if not data_dir.is_dir():
+        print(f"Error: data directory not found: {data_dir}", file=sys.stderr)
+        sys.exit(1)
+    if args.pipeline:
+        if args.large_report or args.pdf_engine != "chromium":
+            print("Error: --pipeline works only with the chromium PDF engine, without --large-report", file=sys.stderr)
+            sys.exit(1)
+        run_pipeline_mode(args, data_dir, template_path, output_path)
+        return
+
+    from irctc_report import build_context, render_html, render_to_file, render_pdf
+    from irctc_report.domains import domain_warnings
+
+    try:
+        if not args.no_validate:
+            # Fail on bad data before the (much slower) render and PDF stages
+            validate_dir(data_dir, cache_dir=args.table_cache)
+        context = build_context(data_dir, history_db=args.history_db, table_cache_dir=args.table_cache)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    for warning in domain_warnings(context):
+        print(f"Warning: {warning}", file=sys.stderr)
+    if fan_out:
+        run_fan_out(args, context, templates, output_path)
+        return
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if args.bundle:
+        from irctc_report.bundle import bundle_html
+
+        html = render_html(template_path, context, args.bytecode_cache)
+        output_path.write_text(bundle_html(html, args.assets_dir.resolve()), encoding="utf-8")
+    else:
+        render_to_file(template_path, context, output_path, args.bytecode_cache)
+        ensure_logo_in_output(output_path, args.assets_dir.resolve())
+    print(f"HTML saved: {output_path}")
+
+    if args.pdf:
+        try:
+            if args.large_report and args.pdf_engine == "chromium":
+                from irctc_report.chunked import render_large_pdf
+
+                pdf_path = render_large_pdf(
+                    template_path,
+                    context,
+                    output_path.with_suffix(".pdf"),
+                    args.assets_dir.resolve(),
+                    chunk_rows=args.chunk_rows,
+                    bundle=args.bundle,
+                    bytecode_cache_dir=args.bytecode_cache,
+                )
+            else:
+                # Other engines are not limited by browser layout cost, so need no chunking
+                pdf_path = render_pdf(context, output_path, engine=args.pdf_engine, offline=args.bundle)
+            print(f"PDF saved: {pdf_path}")
+        except Exception as e:
+            print(f"PDF conversion failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
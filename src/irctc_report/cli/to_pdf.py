@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Convert HTML files to PDF (Playwright).
+
+Usage:
+  python -m scripts.to_pdf [path/to/file.html ...] [--concurrency 4]
+
+Arguments may be glob patterns (e.g. "output/*.html"). Several files are rendered in
+parallel pages of one shared browser; a failure on one file does not stop the others.
+"""
+
+import argparse
+import glob
+import sys
+from pathlib import Path
+
+from irctc_report.cli import PROJECT_ROOT
+
+from irctc_report import convert_many, convert_to_pdf
+
+
+def expand_paths(patterns: list[str]) -> list[Path]:
+    """Expand glob patterns; plain paths are kept as-is so missing files are reported."""
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.extend(Path(p).resolve() for p in sorted(glob.glob(pattern)))
+        else:
+            paths.append(Path(pattern).resolve())
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert HTML files to PDF.")
+    parser.add_argument("paths", nargs="*", help="HTML files or glob patterns")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pages rendered in parallel")
+    args = parser.parse_args()
+
+    if not args.paths:
+        default = PROJECT_ROOT / "output" / "IRCTC_Takedown_Report_generated.html"
+        if not default.exists():
+            print("Usage: python -m scripts.to_pdf <path/to/file.html> [...]", file=sys.stderr)
+            sys.exit(1)
+        html_paths = [default]
+    else:
+        html_paths = expand_paths(args.paths)
+        if not html_paths:
+            print("Error: no files matched", file=sys.stderr)
+            sys.exit(1)
+
+    if len(html_paths) == 1:
+        try:
+            pdf_path = convert_to_pdf(html_paths[0])
+            print(f"PDF saved: {pdf_path}")
+        except (FileNotFoundError, ValueError, RuntimeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    try:
+        results = convert_many(html_paths, concurrency=args.concurrency)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    failed = 0
+    for result in results:
+        if result.ok:
+            print(f"PDF saved: {result.pdf_path}")
+        else:
+            failed += 1
+            print(f"Failed: {result.html_path}: {result.error}", file=sys.stderr)
+    print(f"{len(results) - failed}/{len(results)} converted")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Precompressed variants of generated files, and content-hash ETags for serving them.
+
+:func:`precompress` writes ``<file>.gz`` (and ``<file>.br`` when the optional
+``brotli`` package is installed) next to a generated file, once, at render time, so a
+web server can send the smaller variant without compressing on every request.
+"""
+
+import gzip
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+# Keep a variant only if it is at most this fraction of the original (PDFs barely shrink)
+MAX_RATIO = 0.9
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def precompress(path: Path) -> list[Path]:
+    """Write the compressed variants of ``path`` worth keeping; returns their paths.
+
+    Stale variants from an earlier version of the file are removed.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    # mtime=0 keeps the .gz bytes (and so its ETag) a function of the content only
+    encoded = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    brotli = _brotli()
+    if brotli is not None:
+        encoded["br"] = brotli.compress(data, quality=11)
+    written = []
+    for encoding, suffix in ENCODINGS.items():
+        variant = path.with_name(path.name + suffix)
+        body = encoded.get(encoding)
+        if body is None or len(body) > len(data) * MAX_RATIO:
+            variant.unlink(missing_ok=True)
+            continue
+        tmp = variant.with_name(variant.name + ".tmp")
+        tmp.write_bytes(body)
+        tmp.replace(variant)
+        written.append(variant)
+    return written
+
+
+def variant_for(path: Path, accepted) -> tuple[Path, str | None]:
+    """The file to send for ``path`` and its Content-Encoding (None for the original).
+
+    ``accepted(encoding)`` says whether the client accepts an encoding, e.g. werkzeug's
+    ``request.accept_encodings.quality``.
+    """
+    path = Path(path)
+    for encoding, suffix in ENCODINGS.items():
+        variant = path.with_name(path.name + suffix)
+        if accepted(encoding) and variant.exists():
+            return variant, encoding
+    return path, None
+
+
+@lru_cache(maxsize=1024)
+def _etag(path: str, mtime_ns: int, size: int) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()[:32]
+
+
+def file_etag(path: Path) -> str:
+    """Content hash of ``path`` for use as an ETag (cached while the file is unchanged)."""
+    st = Path(path).stat()
+    return _etag(str(path), st.st_mtime_ns, st.st_size)
@@ -1,7 +1,128 @@
-"""Default content for the IRCTC Takedown Report."""
+"""Default content for the IRCTC Takedown Report.
+
+The fixed wording below is shared by the HTML templates (as Jinja globals, see
+:func:`irctc_report.render.get_environment`) and the ReportLab engine, so the two
+stay in step.
+"""
 
 DEFAULT_KEY_OUTCOMES = [
     "Active phishing exposure: Neutralized",
     "Residual risk: Controlled & Monitored",
     "No immediate passenger-facing compromise observed",
 ]
+
+REPORT_TITLE = "IRCTC – Daily Cyber Threat Suppression & Takedown Status Report"
+
+SECTION_TITLES = {
+    "summary": "1. Executive Summary",
+    "metrics": "2. Key Metrics Snapshot (Daily Dashboard)",
+    "taken_down": "3. Takedown Achievements – Closed & Verified",
+    "newly_completed": "3.1 Newly Completed Takedown (Last 24 Hours)",
+    "takedown_summary": "3.2 Cumulative Takedown Summary",
+    "landscape": "4. Threat Landscape Analysis (Strategic Insight)",
+    "attack_patterns": "4.1 Attack Patterns Observed",
+    "breakdown": "4.2 Threat Breakdown",
+    "under_review": "5. Assets Under Review (Risk Controlled)",
+    "newly_under_review": "5.1 Newly Under Review (Last 24 Hours)",
+    "under_review_status": "5.2 Under Review – Current Status",
+    "in_progress": "6. Assets In Progress (Active Takedown Execution)",
+    "reactivated": "6.1 Newly Reactivated Domains (Previously Takedown)",
+    "in_progress_summary": "6.2 In-Progress Summary",
+    "risk_posture": "7. Risk Posture & Assurance Statement",
+    "actions_taken": "8. Actions Taken by Sveltetech",
+    "forward_actions": "9. Forward Actions (Next 24–72 Hours)",
+    "closing_note": "10. Closing Note",
+}
+
+# Display name of each status (status cards, breakdown table)
+STATUS_LABELS = {
+    "taken_down": "Taken Down",
+    "under_review": "Under Review",
+    "in_progress": "In Progress",
+}
+
+# Header of each table column; the columns of each table are loader.TABLE_COLUMNS
+SERIAL_HEADER = "S.No"
+COLUMN_HEADERS = {
+    "domain_url": "Domain / URL",
+    "reported_on": "Reported On",
+    "last_updated": "Last Updated",
+    "threat_category": "Threat Category",
+    "remarks": "Remarks",
+}
+
+MONITORING_NOTE = (
+    "The under-review assets are currently not hosting active malicious content and may display parking pages, "
+    "lander pages, or resale listings while registrar and platform assessments are ongoing. The in-progress assets "
+    "have had formal takedown requests initiated and are currently under evaluation by the respective registrars, "
+    "hosting providers, cloud platforms, or application marketplaces. All such assets are under continuous "
+    "monitoring through periodic validation checks, reappearance detection, and content status verification."
+)
+
+# (label, text) bullets closing the cumulative takedown summary
+TAKEDOWN_FACTS = [
+    ("Impact", "Prevented credential harvesting, financial fraud attempts, and passenger data misuse"),
+    (
+        "Verification",
+        "All takedowns independently validated and closed. Current residual exposure from closed cases: Nil",
+    ),
+]
+
+# Note under each table, by status
+TABLE_NOTES = {
+    "taken_down": "All completed takedown requests have been verified and formally closed. No further action is "
+    "required unless reappearance or reposting is observed.",
+    "under_review": "Escalation emails have been formally raised with the concerned platforms for the under-review "
+    "cases. Follow-ups are ongoing to expedite resolution.",
+    "in_progress": "These requests are currently in progress and are within standard platform review timelines.",
+}
+
+ATTACK_PATTERNS = [
+    "Extensive typosquatting on IRCTC brand keywords (irctc, tatkal, rail, e-catering, tejas)",
+    "Abuse of modern hosting platforms (Pages.dev, Vercel, cloud CDNs)",
+    "Phishing infrastructure designed to: harvest login credentials; mimic Tatkal booking flows; "
+    "redirect to fraudulent payment pages",
+    "Use of temporary landing pages to evade early detection",
+]
+
+# (label, rating, rating is low)
+RISK_POSTURE = [
+    ("Passenger Credential Risk", "Mitigated", True),
+    ("Brand Abuse", "Actively Suppressed", False),
+    ("Financial Fraud Risk", "Contained", False),
+    ("Re-appearance Monitoring", "Ongoing", False),
+    ("Public-Facing Exposure", "None Observed", True),
+    ("Overall Cyber Risk Rating (Brand Abuse)", "LOW – CONTROLLED", True),
+]
+
+ACTIONS_TAKEN = [
+    "Continuous brand & domain monitoring",
+    "Rapid phishing verification & evidence collection",
+    "Registrar and platform escalations",
+    "Legal & abuse-desk coordination",
+    "Post-takedown verification",
+    "Continuous re-appearance tracking",
+]
+
+FORWARD_ACTIONS = [
+    "Close remaining under-review cases",
+    "Accelerate cloud-platform takedowns",
+    "Monitor for re-registration / domain recycling",
+    "Identify emerging keyword attack clusters",
+    "Continue daily executive reporting to IRCTC",
+]
+
+TEMPLATE_GLOBALS = {
+    "REPORT_TITLE": REPORT_TITLE,
+    "SECTION_TITLES": SECTION_TITLES,
+    "STATUS_LABELS": STATUS_LABELS,
+    "SERIAL_HEADER": SERIAL_HEADER,
+    "COLUMN_HEADERS": COLUMN_HEADERS,
+    "MONITORING_NOTE": MONITORING_NOTE,
+    "TAKEDOWN_FACTS": TAKEDOWN_FACTS,
+    "TABLE_NOTES": TABLE_NOTES,
+    "ATTACK_PATTERNS": ATTACK_PATTERNS,
+    "RISK_POSTURE": RISK_POSTURE,
+    "ACTIONS_TAKEN": ACTIONS_TAKEN,
+    "FORWARD_ACTIONS": FORWARD_ACTIONS,
+}
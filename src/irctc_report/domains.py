@@ -0,0 +1,88 @@
+"""Canonical domain index across the report tables.
+
+The same asset shows up as ``irctc.in``, ``https://www.irctc.in/`` and ``IRCTC.IN``.
+:func:`normalize_domain` maps all of these to one key, and :class:`DomainIndex` is built
+in a single pass over every table. It gives O(1) status lookup, duplicate detection
+across tables and checks on the reactivated-domain list.
+"""
+
+import re
+from typing import Iterable
+
+STATUS_TABLES = ("taken_down", "under_review", "in_progress")
+
+_SCHEME = re.compile(r"^[a-z][a-z0-9+.\-]*://")
+
+
+def normalize_domain(value: str) -> str:
+    """Canonical form of a domain/URL: lower case, no scheme, no ``www.``, no trailing '/'."""
+    canon = _SCHEME.sub("", value.strip().lower())
+    if canon.startswith("www."):
+        canon = canon[4:]
+    return canon.rstrip("/")
+
+
+class DomainIndex:
+    """Where each canonical domain appears: (status, row) entries in table order."""
+
+    def __init__(self):
+        # canonical domain -> first (status, row); only repeats go in _more, to keep the
+        # common single-occurrence case to one dict entry
+        self._first: dict[str, tuple[str, object]] = {}
+        self._more: dict[str, list[tuple[str, object]]] = {}
+
+    @classmethod
+    def build(cls, tables: dict[str, Iterable]) -> "DomainIndex":
+        """Index rows of ``tables`` (status -> rows having ``domain_url``) in one pass."""
+        index = cls()
+        first = index._first
+        more = index._more
+        for status, rows in tables.items():
+            for row in rows:
+                canon = normalize_domain(row.domain_url)
+                if not canon:
+                    continue
+                if canon in first:
+                    more.setdefault(canon, []).append((status, row))
+                else:
+                    first[canon] = (status, row)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._first)
+
+    def __contains__(self, domain: str) -> bool:
+        return normalize_domain(domain) in self._first
+
+    def lookup(self, domain: str) -> list[tuple[str, object]]:
+        """All (status, row) entries for ``domain`` (any spelling); empty if unknown."""
+        canon = normalize_domain(domain)
+        entry = self._first.get(canon)
+        if entry is None:
+            return []
+        return [entry, *self._more.get(canon, ())]
+
+    def status(self, domain: str) -> str | None:
+        """Status of ``domain`` (its first occurrence), or None if it is in no table."""
+        entry = self._first.get(normalize_domain(domain))
+        return entry[0] if entry else None
+
+    def duplicates(self) -> dict[str, list[tuple[str, object]]]:
+        """Canonical domains that occur more than once, within or across tables."""
+        return {canon: [self._first[canon], *rest] for canon, rest in self._more.items()}
+
+    def missing(self, domains: Iterable[str], status: str = "taken_down") -> list[str]:
+        """Those of ``domains`` that never appear with ``status``."""
+        return [d for d in domains if not any(s == status for s, _ in self.lookup(d))]
+
+
+def domain_warnings(context: dict) -> list[str]:
+    """Human-readable data-quality warnings derived from the context's domain index."""
+    warnings = []
+    for item in context.get("duplicate_domains", []):
+        if item.get("reactivated"):
+            continue
+        warnings.append(f"Domain {item['domain']} appears more than once: {', '.join(item['statuses'])}")
+    for domain in context.get("unknown_reactivated_domains", []):
+        warnings.append(f"Reactivated domain {domain} is not in taken_down.csv")
+    return warnings
@@ -0,0 +1,169 @@
+"""Load once, emit many: several templates and output formats from one loaded context.
+
+Producing the daily report, a client summary and a machine-readable export used to
+mean one ``generate_report`` run each, re-reading every CSV and recompiling. Here the
+context is built once; :func:`fan_out` renders it through each template on a thread
+pool, writes the JSON export and CSV summary alongside, and then prints all the HTML
+to PDF in parallel pages of one shared browser (:func:`irctc_report.pdf.convert_many`).
+"""
+
+import contextvars
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from . import metrics
+from .pdf import DEFAULT_PDF_ENGINE, convert_many, render_pdf
+from .render import ensure_logo_in_output, render_html
+
+SUMMARY_COLUMNS = ["section", "status", "item", "value"]
+
+
+class Artifact(NamedTuple):
+    """One output of :func:`fan_out`: where it was (or would have been) written.
+
+    ``error`` is None on success.
+    """
+
+    kind: str  # "html", "pdf", "json" or "csv"
+    path: Path
+    error: str | None = None
+
+
+def output_name(template_path: Path) -> str:
+    """HTML file name for a template: ``X_template.html`` -> ``X_generated.html``."""
+    return f"{Path(template_path).stem.removesuffix('_template')}_generated.html"
+
+
+def export_data(context: dict) -> dict:
+    """The JSON-serializable part of a context: meta, counts, rows, statistics, history."""
+    return {
+        "meta": context["meta"],
+        "counts": context["counts"],
+        "key_outcomes": context["key_outcomes"],
+        "tables": {
+            status: [row.as_dict() for row in context[f"{status}_rows"]]
+            for status in ("taken_down", "under_review", "in_progress")
+        },
+        "stats": context["stats"],
+        "duplicate_domains": context["duplicate_domains"],
+        "unknown_reactivated_domains": context["unknown_reactivated_domains"],
+        "history": context.get("history"),
+    }
+
+
+def write_json(context: dict, path: Path) -> Path:
+    data = json.dumps(export_data(context), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    Path(path).write_bytes(data)
+    metrics.add("bytes_written", len(data), artifact="json")
+    return Path(path)
+
+
+def summary_rows(context: dict) -> list[list]:
+    """The headline numbers as (section, status, item, value) rows."""
+    stats = context["stats"]
+    rows = [["counts", "", name, value] for name, value in context["counts"].items()]
+    for status, counts in stats["threats_by_status"].items():
+        rows.extend(["threats", status, category, n] for category, n in counts.items())
+    for status, buckets in stats["age_buckets"].items():
+        rows.extend(["age", status, label, n] for label, n in buckets)
+    rows.extend(["over_sla", status, "", n] for status, n in stats["over_sla"].items())
+    for name in ("oldest_open_days", "mean_days_to_takedown"):
+        value = stats[name]
+        rows.append(["timing", "", name, "" if value is None else round(value, 2)])
+    return rows
+
+
+def write_csv_summary(context: dict, path: Path) -> Path:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(SUMMARY_COLUMNS)
+        writer.writerows(summary_rows(context))
+    return Path(path)
+
+
+def _render_one(
+    template_path: Path,
+    context: dict,
+    output_path: Path,
+    assets_dir: Path,
+    bundle: bool,
+    bytecode_cache_dir: Path | None,
+) -> Path:
+    html = render_html(template_path, context, bytecode_cache_dir)
+    if bundle:
+        from .bundle import bundle_html
+
+        html = bundle_html(html, assets_dir)
+    data = html.encode("utf-8")
+    output_path.write_bytes(data)
+    metrics.add("bytes_written", len(data), artifact="html")
+    if not bundle:
+        ensure_logo_in_output(output_path, assets_dir)
+    return output_path
+
+
+def fan_out(
+    context: dict,
+    outputs: list[tuple[Path, Path]],
+    assets_dir: Path,
+    pdf: bool = False,
+    json_path: Path | None = None,
+    csv_path: Path | None = None,
+    bundle: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    pdf_engine: str = DEFAULT_PDF_ENGINE,
+    workers: int | None = None,
+) -> list[Artifact]:
+    """Render ``context`` through every (template, html output path) in ``outputs``.
+
+    HTML, JSON and CSV are written concurrently. With ``pdf`` every HTML is then
+    printed by the chromium engine in one shared browser; other engines draw from the
+    context rather than the HTML, so they produce one PDF, for the first output.
+    Failures are recorded per artifact and do not stop the others.
+    """
+    assets_dir = Path(assets_dir)
+    artifacts = []
+    with ThreadPoolExecutor(max_workers=workers or len(outputs) + 2, thread_name_prefix="fanout") as pool:
+
+        def submit(fn, *args):
+            # Run in a copy of the caller's context so metrics reach its run
+            return pool.submit(contextvars.copy_context().run, fn, *args)
+
+        pending = []
+        for template_path, output_path in outputs:
+            output_path = Path(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            future = submit(
+                _render_one, template_path, context, output_path, assets_dir, bundle, bytecode_cache_dir
+            )
+            pending.append(("html", output_path, future))
+        if json_path is not None:
+            pending.append(("json", Path(json_path), submit(write_json, context, json_path)))
+        if csv_path is not None:
+            pending.append(("csv", Path(csv_path), submit(write_csv_summary, context, csv_path)))
+        for kind, path, future in pending:
+            try:
+                future.result()
+                artifacts.append(Artifact(kind, path))
+            except Exception as e:
+                artifacts.append(Artifact(kind, path, f"{type(e).__name__}: {e}"))
+
+    html_paths = [a.path for a in artifacts if a.kind == "html" and a.error is None]
+    if pdf and html_paths:
+        if pdf_engine != "chromium":
+            html_paths = html_paths[:1]
+        with metrics.stage("pdf"):
+            try:
+                if pdf_engine == "chromium":
+                    results = convert_many(html_paths, offline=bundle)
+                    artifacts.extend(
+                        Artifact("pdf", Path(r.html_path).with_suffix(".pdf"), r.error) for r in results
+                    )
+                else:
+                    artifacts.append(Artifact("pdf", render_pdf(context, html_paths[0], engine=pdf_engine)))
+            except Exception as e:
+                artifacts.extend(Artifact("pdf", path.with_suffix(".pdf"), str(e)) for path in html_paths)
+    return artifacts
@@ -0,0 +1,196 @@
+"""SQLite history of daily snapshots, and the day-over-day deltas derived from it.
+
+Each run ingests the day's three tables as a snapshot. A domain's presence in a table
+is stored as a *span*: (domain, status, first_seen, last_seen). Ingesting a day
+extends the spans still present and opens spans for new entries. Storage therefore
+grows with the changes, not with days x rows. Newly completed, newly under review
+and reactivated domains are spans that open on the snapshot date, so they are
+indexed lookups on ``first_seen`` and the cost scales with the size of the delta.
+"""
+
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+
+from .domains import STATUS_TABLES, normalize_domain
+
+# Formats accepted for report_meta.csv's report_date (first match wins)
+DATE_FORMATS = ("%d %B %Y", "%d %b %Y", "%Y-%m-%d", "%d/%m/%Y")
+# Snapshots included in the trend
+TREND_DAYS = 14
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    snapshot_date TEXT PRIMARY KEY,
+    taken_down INTEGER NOT NULL,
+    under_review INTEGER NOT NULL,
+    in_progress INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS spans (
+    domain TEXT NOT NULL,
+    status TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    display TEXT NOT NULL,
+    PRIMARY KEY (domain, status, first_seen)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS spans_first_seen ON spans (first_seen, status);
+CREATE INDEX IF NOT EXISTS spans_last_seen ON spans (last_seen, domain, status);
+"""
+
+
+def parse_report_date(value: str) -> date | None:
+    """The date in a report_date string such as "05 February 2026" (None if unparseable)."""
+    value = value.strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class HistoryStore:
+    """Snapshot history in one SQLite file (created on first use)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _previous_date(self, day: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT MAX(snapshot_date) FROM snapshots WHERE snapshot_date < ?", (day,)
+        ).fetchone()
+        return row[0]
+
+    def ingest(self, snapshot_date: date, tables: dict) -> None:
+        """Record ``tables`` (status -> rows with ``domain_url``) as the snapshot of a day.
+
+        Re-ingesting the latest day replaces it. Days must be ingested in date order:
+        an older day than the latest raises ValueError.
+        """
+        day = snapshot_date.isoformat()
+        conn = self._conn
+        latest = conn.execute("SELECT MAX(snapshot_date) FROM snapshots").fetchone()[0]
+        if latest is not None and day < latest:
+            raise ValueError(f"History already has a later snapshot ({latest}) than {day}")
+        current = {}
+        for status in STATUS_TABLES:
+            for row in tables.get(status, ()):
+                canon = normalize_domain(row.domain_url)
+                if canon:
+                    current.setdefault((canon, status), row.domain_url)
+        prev = self._previous_date(day)
+        with conn:
+            if latest == day:
+                # Undo this day's earlier ingest: drop spans it opened, shorten the rest
+                conn.execute("DELETE FROM spans WHERE first_seen = ?", (day,))
+                conn.execute("UPDATE spans SET last_seen = ? WHERE last_seen = ?", (prev, day))
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS current"
+                " (domain TEXT, status TEXT, display TEXT, PRIMARY KEY (domain, status)) WITHOUT ROWID"
+            )
+            conn.execute("DELETE FROM current")
+            conn.executemany(
+                "INSERT INTO current VALUES (?, ?, ?)",
+                ((canon, status, display) for (canon, status), display in current.items()),
+            )
+            if prev is not None:
+                conn.execute(
+                    "UPDATE spans SET last_seen = :day WHERE last_seen = :prev"
+                    " AND EXISTS (SELECT 1 FROM current c WHERE c.domain = spans.domain AND c.status = spans.status)",
+                    {"day": day, "prev": prev},
+                )
+            conn.execute(
+                "INSERT INTO spans SELECT c.domain, c.status, :day, :day, c.display FROM current c"
+                " WHERE NOT EXISTS (SELECT 1 FROM spans s WHERE s.last_seen = :day"
+                " AND s.domain = c.domain AND s.status = c.status)",
+                {"day": day},
+            )
+            counts = {status: 0 for status in STATUS_TABLES}
+            for _, status in current:
+                counts[status] += 1
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)",
+                (day, counts["taken_down"], counts["under_review"], counts["in_progress"]),
+            )
+            conn.execute("DELETE FROM current")
+
+    def _opened(self, day: str, status: str) -> list[str]:
+        rows = self._conn.execute(
+            "SELECT display FROM spans WHERE first_seen = ? AND status = ? ORDER BY display", (day, status)
+        )
+        return [display for (display,) in rows]
+
+    def deltas(self, snapshot_date: date, trend_days: int = TREND_DAYS) -> dict:
+        """Changes on ``snapshot_date`` relative to the previous snapshot, plus the trend.
+
+        Returns ``previous_date`` (None for the first snapshot, when every list is
+        empty), ``newly_completed``, ``newly_under_review`` and ``reactivated`` (domains
+        as first written in the CSVs) and ``trend`` (per-day counts, oldest first).
+        """
+        day = snapshot_date.isoformat()
+        prev = self._previous_date(day)
+        trend = [
+            {"date": d, "taken_down": td, "under_review": ur, "in_progress": ip, "total": td + ur + ip}
+            for d, td, ur, ip in reversed(
+                self._conn.execute(
+                    "SELECT * FROM snapshots WHERE snapshot_date <= ? ORDER BY snapshot_date DESC LIMIT ?",
+                    (day, trend_days),
+                ).fetchall()
+            )
+        ]
+        result = {
+            "previous_date": prev,
+            "newly_completed": [],
+            "newly_under_review": [],
+            "reactivated": [],
+            "trend": trend,
+        }
+        if prev is None:
+            return result
+        result["newly_completed"] = self._opened(day, "taken_down")
+        result["newly_under_review"] = self._opened(day, "under_review")
+        # Open again today, and taken down in an earlier snapshot
+        rows = self._conn.execute(
+            "SELECT MIN(o.display) FROM spans o WHERE o.first_seen = :day"
+            " AND o.status IN ('under_review', 'in_progress')"
+            " AND EXISTS (SELECT 1 FROM spans t WHERE t.domain = o.domain"
+            " AND t.status = 'taken_down' AND t.first_seen < :day)"
+            " GROUP BY o.domain ORDER BY 1",
+            {"day": day},
+        )
+        result["reactivated"] = [display for (display,) in rows]
+        return result
+
+
+def apply_history(meta: dict, tables: dict, history_db: Path) -> dict:
+    """Ingest today's ``tables`` into ``history_db`` and return its deltas.
+
+    Meta fields left empty in report_meta.csv (newly_completed_domain,
+    newly_under_review_domain, reactivated_domains) are filled in from the deltas;
+    hand-entered values are kept. The snapshot date is the report_date (today if it
+    cannot be parsed).
+    """
+    snapshot_date = parse_report_date(meta["report_date"]) or date.today()
+    with HistoryStore(history_db) as store:
+        store.ingest(snapshot_date, tables)
+        deltas = store.deltas(snapshot_date)
+    if not meta["newly_completed_domain"] and deltas["newly_completed"]:
+        meta["newly_completed_domain"] = ", ".join(deltas["newly_completed"])
+    if not meta["newly_under_review_domain"] and deltas["newly_under_review"]:
+        meta["newly_under_review_domain"] = ", ".join(deltas["newly_under_review"])
+    if not meta["reactivated_domains"]:
+        meta["reactivated_domains"] = deltas["reactivated"]
+    return deltas
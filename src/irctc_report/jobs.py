@@ -0,0 +1,157 @@
+"""Bounded background job queue for report generation (used by the upload web app)."""
+
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """Raised by JobQueue.submit when no more jobs can be accepted."""
+
+
+class Job:
+    """One report generation request, with its own output directory."""
+
+    def __init__(self, output_dir: Path):
+        self.id = uuid.uuid4().hex
+        self.output_dir = Path(output_dir) / self.id
+        self.status = QUEUED
+        self.error: str | None = None
+        self.pdf_error: str | None = None
+        self.html_path: Path | None = None
+        self.pdf_path: Path | None = None
+        self.created = time.time()
+        self.finished: float | None = None
+
+    @property
+    def pending(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "error": self.error,
+            "pdf_error": self.pdf_error,
+            "html_ready": self.html_path is not None and self.html_path.exists(),
+            "pdf_ready": self.pdf_path is not None and self.pdf_path.exists(),
+            "created": self.created,
+            "finished": self.finished,
+        }
+
+
+class JobQueue:
+    """Run jobs on a fixed pool of worker threads with a bounded backlog.
+
+    At most ``workers + max_queued`` jobs are pending at once; beyond that
+    :meth:`submit` raises :class:`QueueFull` so callers can push back (HTTP 429).
+    Only the ``keep`` most recent finished jobs are retained; older ones are forgotten
+    and their output directories removed.
+    """
+
+    def __init__(self, output_dir: Path, workers: int = 2, max_queued: int = 8, keep: int = 100):
+        self.output_dir = Path(output_dir)
+        self.keep = keep
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-job")
+        self._slots = threading.BoundedSemaphore(workers + max_queued)
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self) -> Job:
+        """Take a queue slot and create a job (and its directory) without starting it.
+
+        Lets the caller put inputs in ``job.output_dir`` before :meth:`start`.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise QueueFull("Too many reports in progress; try again shortly.")
+        job = Job(self.output_dir)
+        job.output_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._jobs[job.id] = job
+        return job
+
+    def start(self, job: Job, task: Callable[[Job], None]) -> None:
+        """Queue ``task(job)`` for a reserved job; the task fills in its output paths.
+
+        An exception from the task marks the job failed with its message.
+        """
+        try:
+            self._pool.submit(self._run, job, task)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def cancel(self, job: Job) -> None:
+        """Give back a reserved job that was never started, removing it and its directory."""
+        with self._lock:
+            self._jobs.pop(job.id, None)
+        shutil.rmtree(job.output_dir, ignore_errors=True)
+        self._slots.release()
+
+    def submit(self, task: Callable[[Job], None]) -> Job:
+        """Reserve a job and start ``task`` on it."""
+        job = self.reserve()
+        self.start(job, task)
+        return job
+
+    def complete(self, fill: Callable[[Job], None]) -> Job:
+        """Register a job that is already done (e.g. served from a cache).
+
+        ``fill(job)`` sets its output paths. No worker or queue slot is used.
+        """
+        job = Job(self.output_dir)
+        fill(job)
+        with self._lock:
+            self._finish(job, DONE)
+            self._jobs[job.id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def _run(self, job: Job, task: Callable[[Job], None]) -> None:
+        job.status = RUNNING
+        status = FAILED
+        try:
+            task(job)
+            status = DONE
+        except Exception as e:
+            job.error = str(e)
+        finally:
+            with self._lock:
+                self._finish(job, status)
+            self._slots.release()
+            self._prune()
+
+    @staticmethod
+    def _finish(job: Job, status: str) -> None:
+        # Caller holds the lock. ``finished`` is set before the status leaves
+        # pending, so a job that is not pending always has a finish time.
+        job.finished = time.time()
+        job.status = status
+
+    def _prune(self) -> None:
+        with self._lock:
+            finished = sorted(
+                (j for j in self._jobs.values() if not j.pending and j.finished is not None),
+                key=lambda j: j.finished,
+            )
+            expired = finished[: max(0, len(finished) - self.keep)]
+            for job in expired:
+                del self._jobs[job.id]
+        for job in expired:
+            shutil.rmtree(job.output_dir, ignore_errors=True)
@@ -1,23 +1,56 @@
 """Load report data from CSV files."""
 
+import contextvars
 import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import IO, Iterator
+
+from . import metrics
+from .aggregate import aggregate
+from .domains import DomainIndex, normalize_domain
+from .rows import Row, make_row_factory
 
 # Use utf-8-sig so CSV saved with BOM still has correct column names (e.g. domain_url)
 CSV_ENCODING = "utf-8-sig"
 
 
+# Table files and the canonical columns the template uses from each
+TABLE_COLUMNS = {
+    "taken_down.csv": ["domain_url", "reported_on", "last_updated", "threat_category", "remarks"],
+    "under_review.csv": ["domain_url", "reported_on", "threat_category", "remarks"],
+    "in_progress.csv": ["domain_url", "reported_on", "threat_category", "remarks"],
+}
+
+
+def _text_stream(stream) -> IO[str]:
+    """Wrap bytes or a binary file-like object so csv can read it as text."""
+    if isinstance(stream, (bytes, bytearray)):
+        stream = io.BytesIO(stream)
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    if not hasattr(stream, "readable"):
+        # e.g. a werkzeug FileStorage: read its underlying stream
+        stream = getattr(stream, "stream", stream)
+    return io.TextIOWrapper(stream, encoding=CSV_ENCODING, newline="")
+
+
 def load_meta(data_dir: Path) -> dict:
     path = data_dir / "report_meta.csv"
     if not path.exists():
         raise FileNotFoundError(f"Missing {path}")
     with open(path, newline="", encoding=CSV_ENCODING) as f:
-        rows = list(csv.DictReader(f))
-    if not rows:
+        return _read_meta(f)
+
+
+def _read_meta(f: IO[str]) -> dict:
+    row = next(csv.DictReader(f), None)
+    if row is None:
         raise ValueError("report_meta.csv is empty")
-    row = rows[0]
     reactivated = (row.get("reactivated_domains") or "").strip()
     reactivated_list = [x.strip() for x in reactivated.split(";") if x.strip()]
+    sla_days = (row.get("sla_days") or "").strip()
     newly_completed_desc = (
         (row.get("newly_completed_domain_description") or "").strip()
         or "Successfully taken down and verified."
@@ -35,6 +68,7 @@ def load_meta(data_dir: Path) -> dict:
         "risk_exposure": (row.get("risk_exposure") or "Nil (Closed) / Controlled (Open)").strip(),
         "closing_note": (row.get("closing_note") or "").strip()
         or "All known high-risk assets have been neutralized or are under strict containment and monitoring.",
+        "sla_days": int(sla_days) if sla_days.isdigit() else None,
     }
 
 
@@ -48,59 +82,149 @@ _CANONICAL_KEYS = {
 }
 
 
-def _normalize_row(row: dict, canonical_for_table: list) -> dict:
-    """Produce a row with only canonical keys so template always has e.g. row.domain_url."""
-    out = {}
+def _resolve_columns(fieldnames: list[str], canonical_for_table: list) -> list[tuple[str, int | None]]:
+    """Map each canonical key to the index of its column in the header (None if absent).
+
+    Resolved once per file, so rows are normalized by index instead of re-matching
+    every header against every alias list.
+    """
+    names = [name.strip("\ufeff") for name in fieldnames]  # BOM on first column
+    # Last occurrence wins for duplicate headers, as with csv.DictReader
+    index = {name: i for i, name in enumerate(names)}
+    resolved = []
     for canon in canonical_for_table:
         aliases = _CANONICAL_KEYS.get(canon, [canon])
-        value = ""
-        for key in row:
-            key_stripped = key.strip("\ufeff")  # BOM on first column
-            if key_stripped in aliases or key_stripped == canon:
-                value = (row.get(key) or "").strip()
+        column = None
+        for name in names:
+            if name in aliases or name == canon:
+                column = index[name]
                 break
-        out[canon] = value
-    return out
+        resolved.append((canon, column))
+    return resolved
+
 
+def iter_table(data_dir: Path, filename: str, required_columns: list) -> Iterator[Row]:
+    """Yield normalized rows of a table CSV one at a time (nothing if the file is missing).
 
-def load_table(data_dir: Path, filename: str, required_columns: list) -> list[dict]:
+    Each row is a compact Row with only the canonical keys in ``required_columns`` (so
+    the template always has e.g. row.domain_url); rows where all of them are empty are
+    skipped.
+    """
     path = data_dir / filename
     if not path.exists():
-        return []
+        return
     with open(path, newline="", encoding=CSV_ENCODING) as f:
-        reader = csv.DictReader(f)
-        # Normalize header: strip BOM from first column name
-        if reader.fieldnames:
-            reader.fieldnames = [n.strip("\ufeff") for n in reader.fieldnames]
-        rows = list(reader)
-    out = []
-    for r in rows:
-        row = {k: (v or "").strip() for k, v in r.items()}
-        normalized = _normalize_row(row, required_columns)
-        if any(normalized.get(c) for c in required_columns):
-            out.append(normalized)
-    return out
-
-
-def build_context(data_dir: Path, key_outcomes: list[str] | None = None) -> dict:
+        yield from _iter_rows(f, required_columns)
+
+
+def _iter_rows(f: IO[str], required_columns: list) -> Iterator[Row]:
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return
+    yield from _iter_records(reader, _resolve_columns(header, required_columns))
+
+
+def _iter_records(reader: Iterator[list[str]], columns: list[tuple[str, int | None]]) -> Iterator[Row]:
+    """Rows from the data records of ``reader`` (past the header), given resolved columns."""
+    indexes = [i for _, i in columns]
+    build = make_row_factory(tuple(canon for canon, _ in columns))
+    for record in reader:
+        if not record:
+            continue
+        width = len(record)
+        values = [record[i].strip() if i is not None and i < width else "" for i in indexes]
+        if any(values):
+            yield build(values)
+
+
+def load_table(data_dir: Path, filename: str, required_columns: list) -> list[Row]:
+    return list(iter_table(data_dir, filename, required_columns))
+
+
+def _load_all(data_dir: Path, workers: int, table_cache_dir: Path | None = None) -> tuple[dict, dict]:
+    """report_meta.csv and every table; with ``workers`` > 1 the files are read concurrently."""
+    if table_cache_dir is not None:
+        from . import table_cache
+
+        def load(data_dir, name, columns):
+            return table_cache.load_table(data_dir / name, columns, table_cache_dir)
+
+    else:
+        load = load_table
+    if workers <= 1:
+        meta = load_meta(data_dir)
+        tables = {name: load(data_dir, name, columns) for name, columns in TABLE_COLUMNS.items()}
+        return meta, tables
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="csv-load") as pool:
+        meta = pool.submit(contextvars.copy_context().run, load_meta, data_dir)
+        futures = {
+            name: pool.submit(contextvars.copy_context().run, load, data_dir, name, columns)
+            for name, columns in TABLE_COLUMNS.items()
+        }
+        return meta.result(), {name: f.result() for name, f in futures.items()}
+
+
+def build_context(
+    data_dir: Path,
+    key_outcomes: list[str] | None = None,
+    history_db: Path | None = None,
+    load_workers: int = 1,
+    table_cache_dir: Path | None = None,
+) -> dict:
+    """Load ``data_dir`` into the template context.
+
+    With ``history_db`` the tables are also ingested into that SQLite snapshot history
+    (see :mod:`irctc_report.history`); the deltas against the previous snapshot fill
+    any of newly_completed_domain / newly_under_review_domain / reactivated_domains
+    left empty in report_meta.csv and are available to the template as ``history``.
+    With ``load_workers`` > 1 the CSV files are read on that many threads.
+    With ``table_cache_dir`` the parsed tables are cached there between runs (see
+    :mod:`irctc_report.table_cache`).
+    """
+    with metrics.stage("load"):
+        meta, tables = _load_all(data_dir, load_workers, table_cache_dir)
+    history = None
+    if history_db is not None:
+        from .history import apply_history
+
+        with metrics.stage("history"):
+            by_status = {name.removesuffix(".csv"): rows for name, rows in tables.items()}
+            history = apply_history(meta, by_status, history_db)
+    context = _assemble_context(meta, tables, key_outcomes)
+    context["history"] = history
+    return context
+
+
+def build_context_from_streams(streams: dict, key_outcomes: list[str] | None = None) -> dict:
+    """Like build_context, but read CSVs from open streams instead of a directory.
+
+    ``streams`` maps file names ("report_meta.csv", "taken_down.csv", ...) to text or
+    binary file-like objects (or bytes). report_meta.csv is required; a missing table
+    is treated as empty.
+    """
+    if streams.get("report_meta.csv") is None:
+        raise FileNotFoundError("Missing report_meta.csv")
+    with metrics.stage("load"):
+        meta = _read_meta(_text_stream(streams["report_meta.csv"]))
+        tables = {}
+        for name, columns in TABLE_COLUMNS.items():
+            stream = streams.get(name)
+            tables[name] = list(_iter_rows(_text_stream(stream), columns)) if stream is not None else []
+        context = _assemble_context(meta, tables, key_outcomes)
+    context["history"] = None
+    return context
+
+
+def _assemble_context(meta: dict, tables: dict, key_outcomes: list[str] | None) -> dict:
     from .constants import DEFAULT_KEY_OUTCOMES
 
-    meta = load_meta(data_dir)
-    taken_down = load_table(
-        data_dir,
-        "taken_down.csv",
-        ["domain_url", "reported_on", "last_updated", "threat_category", "remarks"],
-    )
-    under_review = load_table(
-        data_dir,
-        "under_review.csv",
-        ["domain_url", "reported_on", "threat_category", "remarks"],
-    )
-    in_progress = load_table(
-        data_dir,
-        "in_progress.csv",
-        ["domain_url", "reported_on", "threat_category", "remarks"],
-    )
+    taken_down = tables["taken_down.csv"]
+    under_review = tables["under_review.csv"]
+    in_progress = tables["in_progress.csv"]
+    by_status = {name.removesuffix(".csv"): rows for name, rows in tables.items()}
+    for status, rows in by_status.items():
+        metrics.add("rows_loaded", len(rows), table=status)
     counts = {
         "taken_down": len(taken_down),
         "under_review": len(under_review),
@@ -110,6 +234,19 @@ def build_context(data_dir: Path, key_outcomes: list[str] | None = None) -> dict
     reactivated_domains_display = (
         ", ".join(meta["reactivated_domains"]) if meta["reactivated_domains"] else "None in this period."
     )
+    domain_index = DomainIndex.build(by_status)
+    with metrics.stage("aggregate"):
+        stats = aggregate(by_status, meta["report_date"], meta["sla_days"])
+    reactivated = {normalize_domain(d) for d in meta["reactivated_domains"]}
+    duplicate_domains = [
+        {
+            "domain": canon,
+            "statuses": [status for status, _ in entries],
+            # A reactivated domain is expected to be both taken down and open again
+            "reactivated": canon in reactivated,
+        }
+        for canon, entries in domain_index.duplicates().items()
+    ]
     return {
         "meta": meta,
         "counts": counts,
@@ -118,4 +255,8 @@ def build_context(data_dir: Path, key_outcomes: list[str] | None = None) -> dict
         "under_review_rows": under_review,
         "in_progress_rows": in_progress,
         "reactivated_domains_display": reactivated_domains_display,
+        "stats": stats,
+        "domain_index": domain_index,
+        "duplicate_domains": duplicate_domains,
+        "unknown_reactivated_domains": domain_index.missing(meta["reactivated_domains"]),
     }
@@ -0,0 +1,83 @@
+"""Build manifest: skip pipeline stages whose inputs have not changed.
+
+The manifest is a small JSON file (kept in the output directory) recording, per stage,
+a key describing its inputs (content hashes and options) and the hash of the output
+it produced. A stage is up to date when its key matches and the output file on disk
+still has the recorded hash.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable
+
+MANIFEST_NAME = ".build_manifest.json"
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def hash_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def hash_inputs(paths: Iterable[Path], root: Path | None = None) -> dict[str, str]:
+    """Content hashes of the given files; directories contribute every file beneath them.
+
+    Keys are paths relative to ``root`` when possible. Missing paths are skipped (their
+    absence still changes the result, since the key disappears).
+    """
+    hashes = {}
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files = sorted(p for p in path.rglob("*") if p.is_file() and "__pycache__" not in p.parts)
+        elif path.is_file():
+            files = [path]
+        else:
+            continue
+        for file in files:
+            name = str(file)
+            if root is not None:
+                try:
+                    name = str(file.resolve().relative_to(Path(root).resolve()))
+                except ValueError:
+                    pass
+            hashes[name] = hash_file(file)
+    return dict(sorted(hashes.items()))
+
+
+def load_manifest(path: Path) -> dict:
+    """Read a manifest; a missing or unreadable file is an empty manifest."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(path: Path, manifest: dict) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def is_up_to_date(manifest: dict, stage: str, key: dict, output_path: Path) -> bool:
+    """True if ``stage`` was last built from ``key`` and its output is unchanged on disk."""
+    entry = manifest.get(stage)
+    if not entry or entry.get("key") != key:
+        return False
+    output_path = Path(output_path)
+    return output_path.exists() and hash_file(output_path) == entry.get("output")
+
+
+def record(manifest: dict, stage: str, key: dict, output_path: Path) -> str:
+    """Record that ``stage`` produced ``output_path`` from ``key``; returns the output hash."""
+    output_hash = hash_file(output_path)
+    manifest[stage] = {"key": key, "output": output_hash}
+    return output_hash
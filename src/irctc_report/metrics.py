@@ -0,0 +1,150 @@
+"""Lightweight pipeline instrumentation: stage timers, counters, Prometheus text output.
+
+Every :func:`stage` is observed into one process-wide latency histogram labelled by stage
+name, and every :func:`add` into a counter. Inside :func:`record_run`, the same values
+are also collected for that run alone, so a CLI can log one timing line per run.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+PREFIX = "irctc_report"
+STAGE_METRIC = f"{PREFIX}_stage_seconds"
+# Histogram bucket upper bounds, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+HELP = {
+    STAGE_METRIC: "Time spent in each report pipeline stage.",
+    f"{PREFIX}_rows_loaded_total": "Table rows loaded from CSV.",
+    f"{PREFIX}_bytes_written_total": "Bytes of generated output written, by artifact.",
+    f"{PREFIX}_jobs_total": "Upload-app report jobs, by outcome.",
+    f"{PREFIX}_result_cache_total": "Upload-app result cache lookups, by result.",
+    f"{PREFIX}_table_cache_total": "Parsed-table cache lookups, by table and result (hit, append, miss).",
+}
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: tuple, extra: tuple = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    inner = ",".join('{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"')) for k, v in pairs)
+    return "{" + inner + "}"
+
+
+class Registry:
+    """Thread-safe store of counters and histograms."""
+
+    def __init__(self, buckets: tuple = BUCKETS):
+        self.buckets = buckets
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], list] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                # [per-bucket counts..., sum, count]
+                hist = self._histograms[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    hist[i] += 1
+            hist[-2] += value
+            hist[-1] += 1
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((k, list(v)) for k, v in self._histograms.items())
+        lines = []
+        seen = set()
+        for (name, labels), value in counters:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), hist in histograms:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} {HELP.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+            for bound, count in zip(self.buckets, hist):
+                lines.append(f"{name}_bucket{_format_labels(labels, (('le', f'{bound:g}'),))} {count}")
+            lines.append(f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} {hist[-1]}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {hist[-2]:.6f}")
+            lines.append(f"{name}_count{_format_labels(labels)} {hist[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class RunRecord:
+    """Stage timings and counters collected during one :func:`record_run` block."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, float] = {}
+
+    def log_line(self) -> str:
+        """One structured key=value line, e.g. for a cron log."""
+        total = time.perf_counter() - self.started
+        fields = [f"total={total:.3f}s"]
+        fields += [f"{name}={seconds:.3f}s" for name, seconds in self.stages.items()]
+        fields += [f"{name}={value:g}" for name, value in self.counters.items()]
+        return "timing " + " ".join(fields)
+
+
+_current_run: contextvars.ContextVar[RunRecord | None] = contextvars.ContextVar(
+    "irctc_report_run", default=None
+)
+
+
+@contextmanager
+def record_run() -> Iterator[RunRecord]:
+    """Collect the stages and counters of the enclosed block into a RunRecord."""
+    run = RunRecord()
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_run.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the enclosed block as pipeline stage ``name`` (recorded even if it raises)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - started
+        REGISTRY.observe(STAGE_METRIC, seconds, stage=name)
+        run = _current_run.get()
+        if run is not None:
+            run.stages[name] = run.stages.get(name, 0.0) + seconds
+
+
+def add(name: str, value: float = 1, **labels) -> None:
+    """Add ``value`` to counter ``irctc_report_<name>_total`` (and to the current run)."""
+    REGISTRY.inc(f"{PREFIX}_{name}_total", value, **labels)
+    run = _current_run.get()
+    if run is not None:
+        key = ".".join([name, *(str(v) for _, v in sorted(labels.items()))])
+        run.counters[key] = run.counters.get(key, 0) + value
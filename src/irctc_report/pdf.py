@@ -1,6 +1,15 @@
 """Convert HTML report to PDF using Playwright."""
 
+import atexit
+import contextvars
 import pathlib
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Iterable, NamedTuple
+
+from . import metrics
 
 PRINT_CSS = """
 @media print {
@@ -54,31 +63,420 @@ PRINT_CSS = """
 """
 
 
-def convert_to_pdf(html_path: pathlib.Path) -> pathlib.Path:
-    """Convert an HTML file to PDF. Returns the path to the created PDF."""
+PDF_OPTIONS = {
+    "format": "A4",
+    "print_background": True,
+    "margin": {"top": "18px", "bottom": "18px", "left": "18px", "right": "18px"},
+}
+
+
+def _require_playwright():
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise RuntimeError(
+            "Playwright not installed. Run: pip install playwright && playwright install chromium"
+        ) from None
+    return sync_playwright
+
+
+def _resolve_html_path(html_path: pathlib.Path) -> pathlib.Path:
     html_path = pathlib.Path(html_path).resolve()
     if not html_path.exists():
         raise FileNotFoundError(f"HTML file not found: {html_path}")
     if html_path.suffix.lower() not in (".html", ".htm"):
         raise ValueError(f"Expected .html or .htm file, got {html_path.suffix!r}")
-    pdf_path = html_path.with_suffix(".pdf")
+    return html_path
+
+
+def _is_local(url: str) -> bool:
+    return url.startswith(("file:", "data:", "about:"))
+
+
+def _wait_until(offline: bool) -> str:
+    # Offline (bundled) documents have nothing to fetch, so "load" is enough and is
+    # deterministic; "networkidle" would wait out the idle window on every page.
+    return "load" if offline else "networkidle"
+
+
+class _Job:
+    def __init__(
+        self,
+        html_path: pathlib.Path | None,
+        pdf_path: pathlib.Path,
+        offline: bool = False,
+        html: str | None = None,
+        pdf_options: dict | None = None,
+    ):
+        self.html_path = html_path
+        self.pdf_path = pdf_path
+        self.offline = offline
+        self.pdf_options = pdf_options or PDF_OPTIONS
+        # Document to load with page.set_content instead of html_path
+        self.html = html
+        self.future = Future()
+        # The submitter's context, so stages timed on the worker reach its metrics run
+        self.context = contextvars.copy_context()
+
+
+class PdfRenderer:
+    """Keep Chromium browsers warm and render HTML files to PDF on them.
+
+    Playwright's sync API is bound to the thread that started it, so each browser is
+    owned by its own worker thread; jobs are queued and picked up by whichever worker
+    is free. Every job gets a fresh browser context. A browser is relaunched after
+    ``max_jobs`` renders, or when it has crashed (the failed job is retried once).
+
+    Use as a context manager, or call :meth:`close` when done. Workers start lazily on
+    the first :meth:`convert` call.
+    """
+
+    def __init__(self, browsers: int = 1, max_jobs: int = 100):
+        if browsers < 1:
+            raise ValueError("browsers must be >= 1")
+        self.browsers = browsers
+        self.max_jobs = max_jobs
+        self._jobs: queue.Queue = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "PdfRenderer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Launch the worker threads (and their browsers) if not already running."""
+        sync_playwright = _require_playwright()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PdfRenderer is closed")
+            if self._workers:
+                return
+            # Browsers launch concurrently
+            started = []
+            for i in range(self.browsers):
+                ready = Future()
+                t = threading.Thread(
+                    target=self._worker,
+                    args=(sync_playwright, ready, contextvars.copy_context()),
+                    name=f"pdf-renderer-{i}",
+                    daemon=True,
+                )
+                t.start()
+                started.append((t, ready))
+            error = None
+            running = 0
+            for t, ready in started:
+                try:
+                    # Surface launch failures (e.g. Chromium not installed) to the caller
+                    ready.result()
+                    running += 1
+                except Exception as e:
+                    error = error or e
+            if error is not None:
+                # Stop the workers that did launch; the others have already exited
+                for _ in range(running):
+                    self._jobs.put(None)
+                for t, _ in started:
+                    t.join()
+                raise error
+            self._workers = [t for t, _ in started]
+
+    def convert(
+        self,
+        html_path: pathlib.Path,
+        pdf_path: pathlib.Path | None = None,
+        offline: bool = False,
+        pdf_options: dict | None = None,
+    ) -> pathlib.Path:
+        """Render one HTML file to PDF on a warm browser. Returns the PDF path.
+
+        With ``offline=True`` only file:/data: requests are allowed and the page is
+        printed as soon as it has loaded (for self-contained, bundled HTML).
+        ``pdf_options`` replaces the default ``page.pdf()`` options (PDF_OPTIONS).
+        """
+        html_path = _resolve_html_path(html_path)
+        pdf_path = pathlib.Path(pdf_path).resolve() if pdf_path else html_path.with_suffix(".pdf")
+        return self._run(_Job(html_path, pdf_path, offline, pdf_options=pdf_options))
+
+    def convert_html(self, html: str, pdf_path: pathlib.Path, offline: bool = False) -> pathlib.Path:
+        """Render an HTML document held in memory to PDF, without writing it to disk first.
+
+        The page is loaded with ``page.set_content`` and so has no base URL: relative
+        references (e.g. main_logo.png) do not resolve, so pass HTML with such assets
+        inlined (see :func:`irctc_report.bundle.inline_logo`).
+        """
+        pdf_path = pathlib.Path(pdf_path).resolve()
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        return self._run(_Job(None, pdf_path, offline, html=html))
+
+    def _run(self, job: _Job) -> pathlib.Path:
+        self.start()
+        with metrics.stage("pdf"):
+            self._jobs.put(job)
+            pdf_path = job.future.result()
+        metrics.add("bytes_written", pdf_path.stat().st_size, artifact="pdf")
+        return pdf_path
+
+    def close(self) -> None:
+        """Stop the workers and close their browsers."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._jobs.put(None)
+        for t in workers:
+            t.join()
+
+    def _worker(self, sync_playwright, ready: Future, context: contextvars.Context) -> None:
+        try:
+            p = sync_playwright().start()
+        except Exception as e:
+            ready.set_exception(e)
+            return
+        browser = None
+        try:
+            try:
+                # Attributed to the run that started the renderer
+                browser = context.run(_launch, p)
+            except Exception as e:
+                ready.set_exception(e)
+                return
+            ready.set_result(None)
+            jobs_done = 0
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                try:
+                    if jobs_done >= self.max_jobs or not browser.is_connected():
+                        browser = job.context.run(_relaunch, p, browser)
+                        jobs_done = 0
+                    try:
+                        job.context.run(_render, browser, job)
+                    except Exception:
+                        if browser.is_connected():
+                            raise
+                        # Browser crashed mid-job: start a new one and retry once
+                        browser = job.context.run(_relaunch, p, browser)
+                        jobs_done = 0
+                        job.context.run(_render, browser, job)
+                except Exception as e:
+                    job.future.set_exception(e)
+                    continue
+                jobs_done += 1
+                job.future.set_result(job.pdf_path)
+        finally:
+            if browser is not None:
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            p.stop()
+
+
+def _launch(p):
+    with metrics.stage("browser_launch"):
+        return p.chromium.launch()
+
+
+def _relaunch(p, browser):
     try:
-        from playwright.sync_api import sync_playwright
+        browser.close()
+    except Exception:
+        pass
+    return _launch(p)
+
+
+def _render(browser, job: _Job) -> None:
+    with metrics.stage("pdf_page"):
+        _render_page(browser, job)
+
+
+def _render_page(browser, job: _Job) -> None:
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        if job.offline:
+            page.route(
+                "**/*",
+                lambda route: route.continue_() if _is_local(route.request.url) else route.abort(),
+            )
+        if job.html is not None:
+            page.set_content(job.html, wait_until=_wait_until(job.offline))
+        else:
+            page.goto(job.html_path.as_uri(), wait_until=_wait_until(job.offline))
+        page.add_style_tag(content=PRINT_CSS)
+        page.pdf(path=str(job.pdf_path), **job.pdf_options)
+    finally:
+        context.close()
+
+
+_default_renderer: PdfRenderer | None = None
+_default_lock = threading.Lock()
+
+
+def get_renderer() -> PdfRenderer:
+    """Return the process-wide shared renderer (created on first use, closed at exit)."""
+    global _default_renderer
+    with _default_lock:
+        if _default_renderer is None:
+            _default_renderer = PdfRenderer()
+            atexit.register(_default_renderer.close)
+        return _default_renderer
+
+
+def convert_to_pdf(
+    html_path: pathlib.Path,
+    renderer: PdfRenderer | None = None,
+    offline: bool = False,
+) -> pathlib.Path:
+    """Convert an HTML file to PDF. Returns the path to the created PDF.
+
+    Uses ``renderer`` if given, otherwise the shared warm renderer from :func:`get_renderer`.
+    Pass ``offline=True`` for bundled HTML so no network request is made or awaited.
+    """
+    html_path = _resolve_html_path(html_path)
+    _require_playwright()
+    return (renderer or get_renderer()).convert(html_path, offline=offline)
+
+
+class PdfResult(NamedTuple):
+    """Outcome of one file in :func:`convert_many`; ``error`` is None on success."""
+
+    html_path: pathlib.Path
+    pdf_path: pathlib.Path | None
+    error: str | None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def convert_many(
+    html_paths: Iterable[pathlib.Path],
+    concurrency: int = 4,
+    offline: bool = False,
+    pdf_options: dict | None = None,
+) -> list[PdfResult]:
+    """Convert several HTML files to PDF in parallel pages of one shared browser.
+
+    Failures are recorded per file and do not abort the batch. Results are returned in
+    input order. ``offline`` is as for :func:`convert_to_pdf`; ``pdf_options`` replaces
+    the default Playwright ``page.pdf()`` options (PDF_OPTIONS).
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    try:
+        from playwright.async_api import async_playwright
     except ImportError:
         raise RuntimeError(
             "Playwright not installed. Run: pip install playwright && playwright install chromium"
         ) from None
-    file_url = html_path.as_uri()
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto(file_url, wait_until="networkidle")
-        page.add_style_tag(content=PRINT_CSS)
-        page.pdf(
-            path=str(pdf_path),
-            format="A4",
-            print_background=True,
-            margin={"top": "18px", "bottom": "18px", "left": "18px", "right": "18px"},
-        )
-        browser.close()
-    return pdf_path
+    import asyncio
+
+    html_paths = list(html_paths)
+    if not html_paths:
+        return []
+    return asyncio.run(
+        _convert_many(async_playwright, html_paths, concurrency, offline, pdf_options or PDF_OPTIONS)
+    )
+
+
+async def _convert_many(
+    async_playwright, html_paths: list, concurrency: int, offline: bool, pdf_options: dict
+) -> list[PdfResult]:
+    import asyncio
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def local_only(route) -> None:
+        if _is_local(route.request.url):
+            await route.continue_()
+        else:
+            await route.abort()
+
+    async def convert_one(browser, html_path) -> PdfResult:
+        try:
+            html_path = _resolve_html_path(html_path)
+        except (FileNotFoundError, ValueError) as e:
+            return PdfResult(pathlib.Path(html_path), None, str(e))
+        pdf_path = html_path.with_suffix(".pdf")
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                with metrics.stage("pdf_page"):
+                    context = await browser.new_context()
+                    try:
+                        page = await context.new_page()
+                        if offline:
+                            await page.route("**/*", local_only)
+                        await page.goto(html_path.as_uri(), wait_until=_wait_until(offline))
+                        await page.add_style_tag(content=PRINT_CSS)
+                        await page.pdf(path=str(pdf_path), **pdf_options)
+                    finally:
+                        await context.close()
+            except Exception as e:
+                return PdfResult(html_path, None, str(e), time.perf_counter() - started)
+        metrics.add("bytes_written", pdf_path.stat().st_size, artifact="pdf")
+        return PdfResult(html_path, pdf_path, None, time.perf_counter() - started)
+
+    async with async_playwright() as p:
+        with metrics.stage("browser_launch"):
+            browser = await p.chromium.launch()
+        try:
+            return list(await asyncio.gather(*(convert_one(browser, path) for path in html_paths)))
+        finally:
+            await browser.close()
+
+
+# PDF engines: name -> engine(context, html_path, pdf_path, offline) -> pdf_path. An
+# engine may use the rendered HTML, the context, or both.
+def _chromium_engine(context: dict, html_path: pathlib.Path, pdf_path: pathlib.Path, offline: bool) -> pathlib.Path:
+    _require_playwright()
+    return get_renderer().convert(html_path, pdf_path, offline=offline)
+
+
+def _reportlab_engine(context: dict, html_path: pathlib.Path, pdf_path: pathlib.Path, offline: bool) -> pathlib.Path:
+    from .pdf_reportlab import build_pdf
+
+    # The logo ensure_logo_in_output copied next to the HTML (absent for bundled HTML)
+    return build_pdf(context, pdf_path, logo_path=html_path.parent / "main_logo.png")
+
+
+DEFAULT_PDF_ENGINE = "chromium"
+PDF_ENGINES: dict[str, Callable] = {
+    "chromium": _chromium_engine,
+    "reportlab": _reportlab_engine,
+}
+
+
+def register_engine(name: str, engine: Callable) -> None:
+    """Make ``engine(context, html_path, pdf_path, offline)`` available as ``name``."""
+    PDF_ENGINES[name] = engine
+
+
+def render_pdf(
+    context: dict,
+    html_path: pathlib.Path,
+    pdf_path: pathlib.Path | None = None,
+    engine: str = DEFAULT_PDF_ENGINE,
+    offline: bool = False,
+) -> pathlib.Path:
+    """Produce the PDF of a rendered report with the named engine. Returns the PDF path.
+
+    "chromium" (default) prints ``html_path`` in a warm Playwright browser, exactly as
+    :func:`convert_to_pdf`. "reportlab" draws the report from ``context`` without a
+    browser: far less memory and time, with a simpler layout.
+    """
+    if engine not in PDF_ENGINES:
+        raise ValueError(f"Unknown PDF engine {engine!r} (available: {', '.join(PDF_ENGINES)})")
+    html_path = pathlib.Path(html_path).resolve()
+    pdf_path = pathlib.Path(pdf_path).resolve() if pdf_path else html_path.with_suffix(".pdf")
+    return PDF_ENGINES[engine](context, html_path, pdf_path, offline)
@@ -0,0 +1,102 @@
+"""Pipelined report generation: overlap the load, compile and browser-launch stages.
+
+The sequential path reads the CSVs one after another, then compiles the template,
+then launches Chromium once the HTML is on disk. Here the CSVs are read on a thread
+pool while, in parallel, the template is compiled and (with ``pdf=True``) the warm
+browser is launched. The PDF is then rendered from the HTML string in memory
+(``page.set_content``) while the HTML file is written alongside.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from . import metrics
+from .loader import TABLE_COLUMNS, build_context
+from .pdf import PdfRenderer, _require_playwright, get_renderer
+from .render import ensure_logo_in_output, get_template, render_html
+
+
+class PipelineResult(NamedTuple):
+    context: dict
+    html_path: Path
+    pdf_path: Path | None
+    # Why the PDF was not produced (the HTML is written regardless)
+    pdf_error: str | None
+
+
+def _submit(pool: ThreadPoolExecutor, fn, *args):
+    # Run in a copy of the caller's context so stage timings reach its metrics run
+    return pool.submit(contextvars.copy_context().run, fn, *args)
+
+
+def run_pipeline(
+    data_dir: Path,
+    template_path: Path,
+    output_path: Path,
+    assets_dir: Path,
+    pdf: bool = False,
+    bundle: bool = False,
+    bytecode_cache_dir: Path | None = None,
+    history_db: Path | None = None,
+    table_cache_dir: Path | None = None,
+    renderer: PdfRenderer | None = None,
+) -> PipelineResult:
+    """Generate the HTML (and PDF) report with the stages overlapped.
+
+    Load errors (FileNotFoundError, ValueError) are raised; a PDF failure is returned
+    in ``pdf_error``.
+    """
+    output_path = Path(output_path).resolve()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    assets_dir = Path(assets_dir)
+    pdf_path = None
+    pdf_error = None
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="pipeline") as pool:
+        browser = None
+        if pdf:
+            try:
+                _require_playwright()
+            except RuntimeError as e:
+                pdf_error = str(e)
+            else:
+                renderer = renderer or get_renderer()
+                browser = _submit(pool, renderer.start)
+        compiled = _submit(pool, get_template, template_path, bytecode_cache_dir)
+        context = build_context(
+            data_dir,
+            history_db=history_db,
+            load_workers=len(TABLE_COLUMNS) + 1,
+            table_cache_dir=table_cache_dir,
+        )
+        compiled.result()
+        html = render_html(template_path, context, bytecode_cache_dir)
+
+        if bundle:
+            from .bundle import bundle_html
+
+            html = bundle_html(html, assets_dir)
+            page_html = html
+        else:
+            from .bundle import inline_logo
+
+            page_html = inline_logo(html, assets_dir)
+        written = _submit(pool, _write_html, html, output_path, None if bundle else assets_dir)
+
+        if browser is not None:
+            try:
+                browser.result()
+                pdf_path = renderer.convert_html(page_html, output_path.with_suffix(".pdf"), offline=bundle)
+            except Exception as e:
+                pdf_error = str(e)
+        written.result()
+    return PipelineResult(context, output_path, pdf_path, pdf_error)
+
+
+def _write_html(html: str, output_path: Path, assets_dir: Path | None) -> None:
+    data = html.encode("utf-8")
+    output_path.write_bytes(data)
+    metrics.add("bytes_written", len(data), artifact="html")
+    if assets_dir is not None:
+        ensure_logo_in_output(output_path, assets_dir)
@@ -1,18 +1,112 @@
 """Render the report HTML from a Jinja2 template and context."""
 
+import os
+import shutil
 import sys
+import threading
+import uuid
 from pathlib import Path
 
+from . import metrics
+from .constants import TEMPLATE_GLOBALS
 
-def render_html(template_path: Path, context: dict) -> str:
+# One Environment per (template directory, bytecode cache directory). Jinja keeps
+# compiled templates in the environment and, with auto_reload, recompiles a template
+# only when its file's mtime changes.
+_environments: dict[tuple[str, str | None], object] = {}
+_environments_lock = threading.Lock()
+
+
+def _import_jinja2():
     try:
-        from jinja2 import Environment, FileSystemLoader, select_autoescape
+        import jinja2
     except ImportError:
         print("Install Jinja2: pip install jinja2", file=sys.stderr)
         sys.exit(1)
-    env = Environment(
-        loader=FileSystemLoader(str(template_path.parent)),
-        autoescape=select_autoescape(["html", "xml"]),
-    )
-    template = env.get_template(template_path.name)
-    return template.render(**context)
+    return jinja2
+
+
+def get_environment(template_dir: Path, bytecode_cache_dir: Path | None = None):
+    """Return the cached Jinja2 Environment for ``template_dir``.
+
+    With ``bytecode_cache_dir``, compiled templates are also stored on disk so a cold
+    process (e.g. a cron run) can skip compilation. Templates see the shared report
+    wording (:data:`irctc_report.constants.TEMPLATE_GLOBALS`) as globals.
+    """
+    jinja2 = _import_jinja2()
+    template_dir = Path(template_dir).resolve()
+    cache_dir = Path(bytecode_cache_dir).resolve() if bytecode_cache_dir else None
+    key = (str(template_dir), str(cache_dir) if cache_dir else None)
+    with _environments_lock:
+        env = _environments.get(key)
+        if env is None:
+            bytecode_cache = None
+            if cache_dir is not None:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = jinja2.FileSystemBytecodeCache(str(cache_dir))
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(str(template_dir)),
+                autoescape=jinja2.select_autoescape(["html", "xml"]),
+                auto_reload=True,
+                bytecode_cache=bytecode_cache,
+            )
+            env.globals.update(TEMPLATE_GLOBALS)
+            _environments[key] = env
+    return env
+
+
+def get_template(template_path: Path, bytecode_cache_dir: Path | None = None):
+    """Load (or reuse) the compiled template at ``template_path``."""
+    template_path = Path(template_path)
+    env = get_environment(template_path.parent, bytecode_cache_dir)
+    return env.get_template(template_path.name)
+
+
+def render_html(template_path: Path, context: dict, bytecode_cache_dir: Path | None = None) -> str:
+    with metrics.stage("render"):
+        template = get_template(template_path, bytecode_cache_dir)
+        return template.render(**context)
+
+
+def render_to_file(
+    template_path: Path,
+    context: dict,
+    output_path: Path,
+    bytecode_cache_dir: Path | None = None,
+) -> int:
+    """Render straight to ``output_path`` chunk by chunk; returns characters written.
+
+    The report is never held in memory as a single string. Chunks go to a temporary
+    file that replaces ``output_path`` only once rendering succeeds, so an error
+    mid-render leaves the previous report in place.
+    """
+    with metrics.stage("render"):
+        template = get_template(template_path, bytecode_cache_dir)
+        output_path = Path(output_path)
+        tmp = output_path.with_name(f".{output_path.name}.{uuid.uuid4().hex}.tmp")
+        written = 0
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for chunk in template.generate(**context):
+                    f.write(chunk)
+                    written += len(chunk)
+                size = f.tell()
+            os.replace(tmp, output_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        metrics.add("bytes_written", size, artifact="html")
+    return written
+
+
+def ensure_logo_in_output(output_path: Path, assets_dir: Path) -> None:
+    """Copy main_logo.png to output dir so the generated HTML can load it."""
+    logo_src = assets_dir / "main_logo.png"
+    if not logo_src.exists():
+        return
+    out_dir = output_path.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+    logo_dst = out_dir / "main_logo.png"
+    if not logo_dst.exists() or logo_src.stat().st_mtime > logo_dst.stat().st_mtime:
+        with metrics.stage("logo_copy"):
+            shutil.copy2(logo_src, logo_dst)
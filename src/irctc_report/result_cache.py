@@ -0,0 +1,131 @@
+"""Content-addressed on-disk cache of generated reports (used by the upload web app).
+
+An entry is a directory named by :func:`cache_key`: a hash of the uploaded files'
+contents and the template/code version. It holds the rendered HTML, its logo and,
+once first requested, the PDF (so whether a PDF was asked for is not part of the
+key). Readers take their own links with :meth:`ResultCache.export`, so an entry can
+be evicted while its files are still being served. Entries are evicted least recently used
+first once the cache exceeds ``max_bytes``, and unconditionally once unused for
+``max_age`` seconds.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import IO, Iterable
+
+
+def hash_stream(stream: IO[bytes]) -> str:
+    """SHA-256 of a seekable binary stream's contents; the stream is rewound afterwards."""
+    h = hashlib.sha256()
+    stream.seek(0)
+    for block in iter(lambda: stream.read(1 << 16), b""):
+        h.update(block)
+    stream.seek(0)
+    return h.hexdigest()
+
+
+def cache_key(inputs: dict[str, str], version: dict | str = "", **options) -> str:
+    """Key for a result: ``inputs`` maps file names to content hashes."""
+    payload = json.dumps({"inputs": inputs, "version": version, "options": options}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Generated artifacts by key, bounded by total size and age."""
+
+    def __init__(self, root: Path, max_bytes: int = 512 * 1024 * 1024, max_age: float = 7 * 24 * 3600):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def lookup(self, key: str) -> Path | None:
+        """The entry directory for ``key`` (marked as just used), or None if absent/expired."""
+        entry = self._entry(key)
+        try:
+            used = entry.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if time.time() - used > self.max_age:
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        os.utime(entry)
+        return entry
+
+    def put(self, key: str, files: Iterable[Path]) -> Path:
+        """Add ``files`` to the entry for ``key`` (replacing same-named ones); returns it.
+
+        Files are hard-linked when possible (copied otherwise) and each appears
+        atomically, so a concurrent reader never sees a partial file. Runs under the
+        eviction lock, so an entry is never evicted while it is being filled.
+        """
+        entry = self._entry(key)
+        with self._lock:
+            entry.mkdir(parents=True, exist_ok=True)
+            for path in files:
+                path = Path(path)
+                tmp = entry / f".{path.name}.{uuid.uuid4().hex}.tmp"
+                try:
+                    os.link(path, tmp)
+                except OSError:
+                    shutil.copy2(path, tmp)
+                os.replace(tmp, entry / path.name)
+            os.utime(entry)
+        self.evict()
+        return entry
+
+    def export(self, entry: Path, dest: Path) -> list[Path]:
+        """Hard-link (or copy) the files of ``entry`` into ``dest``; returns their new paths.
+
+        Runs under the eviction lock, so the entry is exported whole; raises
+        FileNotFoundError if it has been evicted since :meth:`lookup`.
+        """
+        dest = Path(dest)
+        exported = []
+        with self._lock:
+            paths = list(Path(entry).iterdir())
+            dest.mkdir(parents=True, exist_ok=True)
+            for path in paths:
+                if path.name.startswith(".") or not path.is_file():
+                    # In-progress put() temporaries
+                    continue
+                target = dest / path.name
+                try:
+                    os.link(path, target)
+                except FileNotFoundError:
+                    raise
+                except OSError:
+                    shutil.copy2(path, target)
+                exported.append(target)
+        return exported
+
+    def evict(self) -> None:
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry in self.root.glob("*/*"):
+                try:
+                    used = entry.stat().st_mtime
+                    size = sum(f.stat().st_size for f in entry.iterdir() if f.is_file())
+                except FileNotFoundError:
+                    continue
+                if now - used > self.max_age:
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entries.append((used, size, entry))
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
@@ -0,0 +1,131 @@
+"""Compact row objects for loaded tables.
+
+A per-row dict repeats its keys' hash table in every row. Rows here are instances of a
+small ``__slots__`` class per column set, so each row stores just its values. Values of
+highly repetitive columns are interned, so e.g. a million "Phishing Website" cells share
+one string. Rows still read like the old dicts where it matters: ``row.domain_url``
+(templates), ``row["domain_url"]``, ``row.get(...)``, ``dict(row)`` and equality with a dict.
+"""
+
+import keyword
+import sys
+from functools import lru_cache
+
+# Columns whose values repeat heavily across rows
+INTERNED_COLUMNS = frozenset({"reported_on", "last_updated", "threat_category", "remarks"})
+
+
+class Row:
+    """Base class for table rows; use :func:`row_type` to get a class for given columns."""
+
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self._fields, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, key: str):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self) -> tuple:
+        return self._fields
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def items(self) -> list:
+        return [(name, getattr(self, name)) for name in self._fields]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def as_dict(self) -> dict:
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Row):
+            return self._fields == other._fields and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Row({', '.join(f'{k}={v!r}' for k, v in self.items())})"
+
+    def __reduce__(self):
+        return (_rebuild_row, (self._fields, self.values()))
+
+
+def _make_init(fields: tuple):
+    """An ``__init__`` assigning each field directly, about twice as fast as Row's loop.
+
+    Generated like namedtuple's ``__new__``; used only for plain identifier fields.
+    """
+    if not all(name.isidentifier() and not keyword.iskeyword(name) for name in fields):
+        return None
+    args = ", ".join(fields)
+    body = "".join(f"    self.{name} = {name}\n" for name in fields) or "    pass\n"
+    namespace = {}
+    exec(f"def __init__(self, {args}):\n{body}", namespace)
+    return namespace["__init__"]
+
+
+@lru_cache(maxsize=None)
+def row_type(fields: tuple) -> type:
+    """The Row subclass with one slot per column in ``fields`` (cached per column set)."""
+    namespace = {"__slots__": fields, "_fields": fields}
+    init = _make_init(fields)
+    if init is not None:
+        namespace["__init__"] = init
+    return type("Row", (Row,), namespace)
+
+
+def _rebuild_row(fields: tuple, values: tuple) -> Row:
+    return row_type(fields)(*values)
+
+
+def make_row_factory(fields: tuple):
+    """Return ``build(values)`` creating a Row from a sequence of stripped values.
+
+    Values of INTERNED_COLUMNS are interned.
+    """
+    cls = row_type(tuple(fields))
+    interned = [i for i, name in enumerate(fields) if name in INTERNED_COLUMNS]
+    intern = sys.intern
+
+    def build(values: list) -> Row:
+        for i in interned:
+            values[i] = intern(values[i])
+        return cls(*values)
+
+    return build
+
+
+def rows_from_columns(fields: tuple, columns: list) -> list[Row]:
+    """Rows from dictionary-encoded columns, one ``(values, codes)`` pair per field.
+
+    Row ``n`` has ``values[codes[n]]`` in each field. The column-wise counterpart of
+    :func:`make_row_factory`: INTERNED_COLUMNS values are interned, here once per
+    distinct value instead of once per row.
+    """
+    cls = row_type(tuple(fields))
+    decoded = []
+    for name, (values, codes) in zip(fields, columns):
+        if name in INTERNED_COLUMNS:
+            values = [sys.intern(v) for v in values]
+        decoded.append(map(values.__getitem__, codes))
+    return [cls(*row) for row in zip(*decoded)]
@@ -0,0 +1,192 @@
+"""On-disk cache of parsed table CSVs, so unchanged or append-only inputs load fast.
+
+Each table's normalized rows are stored column by column and dictionary-encoded: per
+column, its distinct values and an array of indexes into them (``marshal``, which
+only ever yields plain data, never running code on load as a pickle could). The
+entry also records the size, mtime and SHA-256 of the CSV it was parsed from. When a
+table is loaded:
+
+- same size and mtime: the cached rows are used without reading the CSV;
+- same content (the file was only touched or rewritten unchanged): likewise, after
+  hashing it;
+- the file grew and still starts with the cached bytes (rows appended, as happens to
+  taken_down.csv every day): only the new trailing rows are parsed;
+- anything else: the file is parsed in full and the entry replaced.
+
+Rows built from an entry intern the same columns as a fresh parse
+(:func:`irctc_report.rows.rows_from_columns`).
+"""
+
+import csv
+import hashlib
+import io
+import marshal
+import mmap
+import os
+import uuid
+from array import array
+from operator import attrgetter
+from pathlib import Path
+
+from . import metrics
+from .loader import CSV_ENCODING, _iter_records, _resolve_columns
+from .rows import Row, rows_from_columns
+
+# Bump when the entry layout or row normalization changes
+FORMAT_VERSION = 3
+# Array types for the per-column value indexes, smallest that fits first
+_CODE_TYPES = ("B", "H", "I")
+
+
+def _entry_path(cache_dir: Path, path: Path, suffix: str = ".marshal") -> Path:
+    # One entry per CSV path, so data dirs of different clients do not collide
+    digest = hashlib.sha256(os.fsencode(path.resolve())).hexdigest()[:16]
+    return cache_dir / f"{path.name}.{digest}{suffix}"
+
+
+def _read_entry(entry_path: Path, fields: tuple) -> dict | None:
+    try:
+        # Mapped rather than read, so the file's bytes are not held on the heap as well
+        with open(entry_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            entry = marshal.loads(m)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError):
+        # Truncated or foreign file: treat as absent
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("format") != FORMAT_VERSION
+        or entry.get("fields") != fields
+        or entry.get("code_sizes") != [array(t).itemsize for t in _CODE_TYPES]
+    ):
+        return None
+    return entry
+
+
+def _write_entry(entry_path: Path, entry: dict) -> None:
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry_path.with_name(f".{entry_path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(marshal.dumps(entry))
+        os.replace(tmp, entry_path)
+    except OSError:
+        # The cache only saves time; an unwritable cache dir must not fail the load
+        pass
+
+
+def _encode(rows: list[Row], fields: tuple) -> list[tuple[tuple, str | None, bytes | None]]:
+    """(distinct values, index array type, index array bytes) for each field of ``rows``.
+
+    A column with no repeated value (e.g. domain_url) is stored as its values alone,
+    with None for the indexes.
+    """
+    columns = []
+    for name in fields:
+        index: dict[str, int] = {}
+        codes = [index.setdefault(v, len(index)) for v in map(attrgetter(name), rows)]
+        if len(index) == len(codes):
+            columns.append((tuple(index), None, None))
+            continue
+        code_type = next(t for t in _CODE_TYPES if len(index) <= 1 << (8 * array(t).itemsize))
+        columns.append((tuple(index), code_type, array(code_type, codes).tobytes()))
+    return columns
+
+
+def _decode(entry: dict, fields: tuple) -> list[Row] | None:
+    """The entry's rows, or None if its columns are inconsistent."""
+    try:
+        columns = []
+        for values, code_type, data in entry["columns_data"]:
+            if code_type is not None and code_type not in _CODE_TYPES:
+                return None
+            codes = range(len(values)) if data is None else memoryview(data).cast(code_type)
+            if len(codes) != entry["rows"] or (data is not None and codes and max(codes) >= len(values)):
+                return None
+            columns.append((values, codes))
+        if len(columns) != len(fields):
+            return None
+        return rows_from_columns(fields, columns)
+    except (KeyError, ValueError, TypeError):
+        return None
+
+
+def _parse(text: str, columns: list | None, fields: tuple) -> tuple[list | None, list[Row]]:
+    """Rows of ``text``; with ``columns`` None, the first record is the header to resolve."""
+    reader = csv.reader(io.StringIO(text, newline=""))
+    if columns is None:
+        header = next(reader, None)
+        if header is None:
+            return None, []
+        columns = _resolve_columns(header, list(fields))
+    return columns, list(_iter_records(reader, columns))
+
+
+def load_table(path: Path, required_columns: list, cache_dir: Path) -> list[Row]:
+    """Like :func:`irctc_report.loader.load_table` for ``path``, through the cache in ``cache_dir``."""
+    path = Path(path)
+    fields = tuple(required_columns)
+    entry_path = _entry_path(Path(cache_dir), path)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return []
+    entry = _read_entry(entry_path, fields)
+    cached = _decode(entry, fields) if entry is not None else None
+    if cached is None:
+        entry = None
+    elif (entry["size"], entry["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+        metrics.add("table_cache", 1, table=path.stem, result="hit")
+        return cached
+
+    with open(path, "rb") as f:
+        before = os.fstat(f.fileno())
+        data = f.read()
+        after = os.fstat(f.fileno())
+    view = memoryview(data)
+    result = "miss"
+    if entry is not None and entry["size"] <= len(data):
+        digest = hashlib.sha256(view[: entry["size"]])
+        if digest.copy().hexdigest() == entry["sha256"]:
+            if entry["size"] == len(data):
+                result = "hit"
+            elif entry["columns"] is not None and entry["ends_with_newline"]:
+                result = "append"
+        digest.update(view[entry["size"] :])
+    else:
+        digest = hashlib.sha256(view)
+
+    if result == "hit":
+        rows = cached
+    elif result == "append":
+        # Only the new trailing records; the header was resolved when the entry was made
+        columns, new_rows = _parse(bytes(view[entry["size"] :]).decode("utf-8"), entry["columns"], fields)
+        rows = cached + new_rows
+    else:
+        columns, rows = _parse(data.decode(CSV_ENCODING), None, fields)
+    metrics.add("table_cache", 1, table=path.stem, result=result)
+
+    if (before.st_size, before.st_mtime_ns) != (after.st_size, after.st_mtime_ns) or after.st_size != len(data):
+        # Written to while being read: the entry would not describe these bytes
+        return rows
+    if result == "hit":
+        # Same content under a new mtime: only the mtime changes
+        _write_entry(entry_path, {**entry, "mtime_ns": after.st_mtime_ns})
+    else:
+        _write_entry(
+            entry_path,
+            {
+                "format": FORMAT_VERSION,
+                "fields": fields,
+                "columns": tuple(columns) if columns is not None else None,
+                "size": len(data),
+                "mtime_ns": after.st_mtime_ns,
+                "sha256": digest.hexdigest(),
+                "ends_with_newline": data.endswith(b"\n"),
+                "code_sizes": [array(t).itemsize for t in _CODE_TYPES],
+                "rows": len(rows),
+                "columns_data": _encode(rows, fields),
+            },
+        )
+    return rows
@@ -0,0 +1,247 @@
+"""Validate report CSVs before anything is loaded or rendered.
+
+The loader is lenient: a missing column becomes empty strings and a bad date is just
+left out of the statistics, so a broken export would otherwise be noticed only in the
+finished PDF. :func:`validate_dir` and :func:`validate_streams` read each file once and
+collect every problem with its file and line:
+
+- report_meta.csv: a data row, a parseable ``report_date``, an integer ``sla_days``;
+- tables: every column the template uses (under any header alias the loader accepts),
+  a domain on every row, dd/mm/yyyy dates (``last_updated`` not before
+  ``reported_on``), a known ``threat_category`` and no domain listed twice in one
+  table.
+
+Domains repeated across tables stay warnings (see :func:`irctc_report.domains.domain_warnings`),
+since a reactivated domain is legitimately in two.
+
+With a ``cache_dir`` (the table cache directory), each file's problems are saved next
+to its table-cache entry, keyed like it by size, mtime and SHA-256, so a run over
+unchanged CSVs does not parse them again.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import IO
+
+from .aggregate import THREAT_LABELS, parse_dmy
+from .domains import normalize_domain
+from .history import parse_report_date
+from .loader import _CANONICAL_KEYS, CSV_ENCODING, TABLE_COLUMNS, _resolve_columns, _text_stream
+
+# Accepted threat_category values
+THREAT_CATEGORIES = tuple(THREAT_LABELS)
+# Problems listed in the error message (the rest are counted)
+MAX_LISTED = 50
+# Bump when the checks change, so saved results are not reused
+CHECKS_VERSION = 1
+
+
+class SchemaError(ValueError):
+    """Report data failed validation; ``problems`` lists each as "file:line: message"."""
+
+    def __init__(self, problems: list[str]):
+        self.problems = problems
+        lines = problems[:MAX_LISTED]
+        if len(problems) > MAX_LISTED:
+            lines.append(f"... and {len(problems) - MAX_LISTED} more")
+        noun = "problem" if len(problems) == 1 else "problems"
+        super().__init__(f"invalid report data ({len(problems)} {noun}):\n" + "\n".join(f"  {p}" for p in lines))
+
+
+def _check_meta(f: IO[str], name: str = "report_meta.csv") -> list[str]:
+    reader = csv.DictReader(f)
+    row = next(reader, None)
+    if row is None:
+        return [f"{name}:1: no data row"]
+    problems = []
+    line = reader.line_num
+    if "report_date" not in (reader.fieldnames or []):
+        problems.append(f"{name}:1: missing column 'report_date'")
+    else:
+        report_date = (row.get("report_date") or "").strip()
+        if parse_report_date(report_date) is None:
+            problems.append(f"{name}:{line}: report_date {report_date!r} is not a date such as '05 February 2026'")
+    sla_days = (row.get("sla_days") or "").strip()
+    if sla_days and not sla_days.isdigit():
+        problems.append(f"{name}:{line}: sla_days {sla_days!r} is not a whole number of days")
+    return problems
+
+
+def _check_table(f: IO[str], name: str) -> list[str]:
+    """Problems in one table CSV, in file order."""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        return [f"{name}:1: empty file (no header row)"]
+    columns = _resolve_columns(header, TABLE_COLUMNS[name])
+    problems = [
+        f"{name}:1: missing column '{canon}' (accepted headers: {', '.join(_CANONICAL_KEYS.get(canon, [canon]))})"
+        for canon, i in columns
+        if i is None
+    ]
+    # Only present columns are checked: a missing one is reported once, above
+    checked = [(canon, i) for canon, i in columns if i is not None]
+    indexes = [i for _, i in checked]
+    position = {canon: n for n, (canon, _) in enumerate(checked)}
+    domain_at = position.get("domain_url")
+    reported_at = position.get("reported_on")
+    updated_at = position.get("last_updated")
+    category_at = position.get("threat_category")
+    categories = frozenset(THREAT_CATEGORIES)
+    seen: dict[str, int] = {}
+    for record in reader:
+        width = len(record)
+        values = [record[i].strip() if i < width else "" for i in indexes]
+        if not any(values):
+            # Skipped by the loader as well
+            continue
+        line = reader.line_num
+        if domain_at is not None:
+            domain = values[domain_at]
+            if not domain:
+                problems.append(f"{name}:{line}: empty domain_url")
+            else:
+                canon = normalize_domain(domain)
+                first = seen.setdefault(canon, line)
+                if first != line:
+                    problems.append(f"{name}:{line}: duplicate domain {domain!r} (first on line {first})")
+        reported_day = None
+        if reported_at is not None:
+            reported = values[reported_at]
+            reported_day = parse_dmy(reported)
+            if reported_day is None:
+                problems.append(f"{name}:{line}: reported_on {reported!r} is not a dd/mm/yyyy date")
+        if updated_at is not None and values[updated_at]:
+            updated = values[updated_at]
+            updated_day = parse_dmy(updated)
+            if updated_day is None:
+                problems.append(f"{name}:{line}: last_updated {updated!r} is not a dd/mm/yyyy date")
+            elif reported_day is not None and updated_day < reported_day:
+                problems.append(f"{name}:{line}: last_updated {updated} is before reported_on {reported}")
+        if category_at is not None and values[category_at] not in categories:
+            problems.append(
+                f"{name}:{line}: threat_category {values[category_at]!r} is not one of {', '.join(THREAT_CATEGORIES)}"
+            )
+    return problems
+
+
+def _check_text(f: IO[str], name: str) -> tuple[str, ...]:
+    try:
+        if name == "report_meta.csv":
+            return tuple(_check_meta(f))
+        return tuple(_check_table(f, name))
+    except UnicodeDecodeError as e:
+        return (f"{name}: not UTF-8 text ({e.reason} at byte {e.start})",)
+
+
+@lru_cache(maxsize=64)
+def _check_file(path: str, name: str, mtime_ns: int, size: int, cache_dir: str | None = None) -> tuple[str, ...]:
+    # Keyed by mtime/size, so watch mode and repeated runs re-check only changed files
+    if cache_dir is not None:
+        return _check_file_cached(Path(path), name, Path(cache_dir))
+    with open(path, newline="", encoding=CSV_ENCODING) as f:
+        return _check_text(f, name)
+
+
+def _check_file_cached(path: Path, name: str, cache_dir: Path) -> tuple[str, ...]:
+    """Problems in ``path``, reusing the result saved for the same content in ``cache_dir``."""
+    from .table_cache import _entry_path
+
+    saved_path = _entry_path(cache_dir, path, ".validate.json")
+    try:
+        saved = json.loads(saved_path.read_bytes())
+        if not isinstance(saved, dict) or saved.get("version") != CHECKS_VERSION:
+            saved = None
+    except (OSError, ValueError):
+        saved = None
+    st = path.stat()
+    if saved is not None and (saved["size"], saved["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+        return tuple(saved["problems"])
+    with open(path, "rb") as f:
+        before = os.fstat(f.fileno())
+        data = f.read()
+        after = os.fstat(f.fileno())
+    sha256 = hashlib.sha256(data).hexdigest()
+    if saved is not None and saved["sha256"] == sha256:
+        problems = tuple(saved["problems"])
+    else:
+        try:
+            text = data.decode(CSV_ENCODING)
+        except UnicodeDecodeError as e:
+            problems = (f"{name}: not UTF-8 text ({e.reason} at byte {e.start})",)
+        else:
+            problems = _check_text(io.StringIO(text, newline=""), name)
+    if (before.st_size, before.st_mtime_ns) == (after.st_size, after.st_mtime_ns) and after.st_size == len(data):
+        # Not written to while being read, so the result describes exactly these bytes
+        saved = {
+            "version": CHECKS_VERSION,
+            "size": len(data),
+            "mtime_ns": after.st_mtime_ns,
+            "sha256": sha256,
+            "problems": list(problems),
+        }
+        try:
+            saved_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = saved_path.with_name(f".{saved_path.name}.{uuid.uuid4().hex}.tmp")
+            tmp.write_text(json.dumps(saved), encoding="utf-8")
+            os.replace(tmp, saved_path)
+        except OSError:
+            # Saving only saves time; an unwritable cache dir must not fail validation
+            pass
+    return problems
+
+
+def validate_dir(data_dir: Path, cache_dir: Path | None = None) -> None:
+    """Raise :class:`SchemaError` listing every problem in ``data_dir``'s CSVs.
+
+    report_meta.csv is required; a missing table is allowed (it loads as empty).
+    With ``cache_dir`` (normally the ``table_cache_dir`` the data is then loaded
+    with), results for unchanged files are reused across runs.
+    """
+    data_dir = Path(data_dir)
+    cache = str(Path(cache_dir).resolve()) if cache_dir is not None else None
+    problems = []
+    for name in ("report_meta.csv", *TABLE_COLUMNS):
+        path = data_dir / name
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            if name == "report_meta.csv":
+                problems.append(f"{name}: file is missing")
+            continue
+        problems.extend(_check_file(str(path), name, st.st_mtime_ns, st.st_size, cache))
+    if problems:
+        raise SchemaError(problems)
+
+
+def validate_streams(streams: dict) -> None:
+    """Like :func:`validate_dir` for the streams of ``build_context_from_streams``.
+
+    Seekable streams are rewound afterwards, so they can then be loaded.
+    """
+    problems = []
+    for name in ("report_meta.csv", *TABLE_COLUMNS):
+        stream = streams.get(name)
+        if stream is None:
+            if name == "report_meta.csv":
+                problems.append(f"{name}: file is missing")
+            continue
+        text = _text_stream(stream)
+        try:
+            problems.extend(_check_meta(text) if name == "report_meta.csv" else _check_table(text, name))
+        except UnicodeDecodeError as e:
+            problems.append(f"{name}: not UTF-8 text ({e.reason} at byte {e.start})")
+        finally:
+            if text is not stream and isinstance(text, io.TextIOWrapper):
+                # Do not let the wrapper close the caller's stream
+                text.detach()
+            if hasattr(stream, "seek"):
+                stream.seek(0)
+    if problems:
+        raise SchemaError(problems)
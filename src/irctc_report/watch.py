@@ -0,0 +1,211 @@
+"""Watch files and directories for changes: inotify on Linux, polling elsewhere.
+
+:class:`Watcher` reports which watched paths changed; :func:`changes` groups bursts
+of events (e.g. a spreadsheet export writing several CSVs) into one batch, yielded
+once no further change has arrived for ``debounce`` seconds.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# inotify(7) event bits
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows)
+
+
+def _ignored(name: str) -> bool:
+    """Editor swap/backup files and other dotfiles, which never affect the report."""
+    return name.startswith((".", "#")) or name.endswith(("~", ".swp", ".swx", ".tmp"))
+
+
+def _files(root: Path) -> Iterator[Path]:
+    if root.is_file():
+        yield root
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not _ignored(d) and d != "__pycache__"]
+        for name in filenames:
+            if not _ignored(name):
+                yield Path(dirpath) / name
+
+
+class _Inotify:
+    def __init__(self, roots: list[Path]):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        self._roots = roots
+        try:
+            for root in roots:
+                if root.is_dir():
+                    for dirpath, dirnames, _ in os.walk(root):
+                        dirnames[:] = [d for d in dirnames if not _ignored(d) and d != "__pycache__"]
+                        self._add(Path(dirpath))
+                else:
+                    # A single file: watch its directory (editors replace files on save)
+                    self._add(root.parent)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def _add(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._dirs[wd] = directory
+
+    def _add_tree(self, directory: Path) -> set[Path]:
+        """Watch a new directory and its subdirectories; return the files already in it.
+
+        Files written before the watch was added raise no event of their own. If a watch
+        cannot be added (the directory is gone again, or the inotify watch limit is
+        reached), the directory itself is reported as changed instead.
+        """
+        try:
+            for dirpath, dirnames, _ in os.walk(directory):
+                dirnames[:] = [d for d in dirnames if not _ignored(d) and d != "__pycache__"]
+                self._add(Path(dirpath))
+        except OSError:
+            return {directory}
+        return set(_files(directory))
+
+    def _watched(self, path: Path) -> bool:
+        return any(path == root or root in path.parents for root in self._roots)
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return set()
+            changed = self._read_events()
+            if changed:
+                return changed
+
+    def _read_events(self) -> set[Path]:
+        buf = os.read(self._fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+            name = buf[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: treat everything as changed
+                changed.update(self._roots)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            name = os.fsdecode(name)
+            path = directory / name
+            if _ignored(name) or not self._watched(path):
+                continue
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    changed |= self._add_tree(path)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _Poller:
+    def __init__(self, roots: list[Path], interval: float):
+        self._roots = roots
+        self._interval = interval
+        self._state = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        state = {}
+        for root in self._roots:
+            for path in _files(root):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                state[path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._scan()
+            changed = {p for p in state.keys() | self._state.keys() if state.get(p) != self._state.get(p)}
+            self._state = state
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return set()
+            time.sleep(self._interval if remaining is None else min(self._interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+class Watcher:
+    """Report changed files under ``paths`` (files or directories).
+
+    Uses inotify where available (Linux) unless ``poll=True``, and otherwise polls
+    modification times every ``poll_interval`` seconds.
+    """
+
+    def __init__(self, paths: Iterable[Path], poll: bool = False, poll_interval: float = 1.0):
+        roots = [Path(p).resolve() for p in paths]
+        self.backend = None
+        if not poll and sys.platform.startswith("linux"):
+            try:
+                self._impl = _Inotify(roots)
+                self.backend = "inotify"
+            except (OSError, AttributeError):
+                pass
+        if self.backend is None:
+            self._impl = _Poller(roots, poll_interval)
+            self.backend = "polling"
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until something changes (or ``timeout`` seconds pass); return changed paths."""
+        return self._impl.wait(timeout)
+
+    def close(self) -> None:
+        self._impl.close()
+
+    def __enter__(self) -> "Watcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def changes(watcher: Watcher, debounce: float = 1.0) -> Iterator[set[Path]]:
+    """Yield batches of changed paths, each once ``debounce`` seconds have passed quietly."""
+    while True:
+        batch = watcher.wait()
+        while batch:
+            more = watcher.wait(debounce)
+            if not more:
+                break
+            batch |= more
+        if batch:
+            yield batch
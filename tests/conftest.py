@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Same layout as the scripts: the package lives in src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
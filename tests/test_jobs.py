@@ -0,0 +1,26 @@
+import threading
+
+from irctc_report.jobs import DONE, JobQueue
+
+
+def test_complete_with_job_finishing_concurrently(tmp_path):
+    """A job whose status is already terminal but whose finish time is unset must not break pruning."""
+    queue = JobQueue(tmp_path, workers=1, keep=1)
+    racing = queue.reserve()
+    racing.status = DONE  # finished is still None
+    job = queue.complete(lambda j: None)
+    assert queue.get(job.id) is job
+    assert queue.get(racing.id) is racing
+    queue.shutdown()
+
+
+def test_finished_jobs_always_have_finish_time(tmp_path):
+    queue = JobQueue(tmp_path, workers=4, max_queued=50, keep=3)
+    release = threading.Event()
+    jobs = [queue.submit(lambda j: release.wait()) for _ in range(20)]
+    release.set()
+    for _ in range(20):
+        queue.complete(lambda j: None)
+    queue.shutdown()
+    assert all(j.finished is not None for j in jobs if not j.pending)
+    assert sum(1 for j in jobs if queue.get(j.id) is not None) <= 3